@@ -23,7 +23,7 @@ Provides three integration points:
 
 __version__ = "0.1.0"
 
-from .client import GoodmemClient
+from .client import GoodmemAsyncClient, GoodmemClient
 from .plugin import GoodmemPlugin
 from .tools import (
     GoodmemFetchResponse,
@@ -44,6 +44,7 @@ from .tools import (
 
 __all__ = [
     "GoodmemClient",
+    "GoodmemAsyncClient",
     "GoodmemPlugin",
     "GoodmemSaveTool",
     "GoodmemFetchTool",
@@ -16,27 +16,994 @@
 
 Lives under plugins/goodmem and is shared: used by GoodmemPlugin and
 re-exported for use by tools (goodmem_save, goodmem_fetch). Uses httpx for
-HTTP calls.
+HTTP calls. ``GoodmemAsyncClient`` is the asyncio-native client;
+``GoodmemClient`` is the blocking client and also exposes the hot read paths
+as ``a``-prefixed coroutines that delegate to its ``GoodmemAsyncClient``, so
+independent calls can be awaited concurrently with ``asyncio.gather``.
+
+Request and response bodies are encoded with ``orjson`` when it is installed
+(``pip install goodmem-adk[fast]``) and with the stdlib ``json`` otherwise.
 """
 
+import asyncio
+import contextlib
+import copy
+import io
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    ClassVar,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import quote
 
 import httpx
 
+try:
+  import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+  orjson = None  # type: ignore[assignment]
+
+# Connection pool shared by the sync and async transports of each client.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0,
+)
+
+# Upper bound on concurrent batchGet requests from the sync client.
+_BATCH_MAX_WORKERS = 8
+
+# Built once and set on the clients instead of passed to every request. The
+# short connect/pool limits fail fast on an unreachable server instead of
+# spending the whole read budget.
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=5.0)
+# Binary uploads (insert_memory_binary) can take much longer to send and
+# process than JSON calls.
+_UPLOAD_TIMEOUT = httpx.Timeout(120.0, connect=5.0, pool=5.0)
+
+
+# Headers for requests whose body is pre-encoded with ``_json_dumps``.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Shared by ``GoodmemClient._safe_json_dumps``. ``default=repr`` renders
+# values JSON cannot represent instead of failing the whole dump.
+_DEBUG_ENCODER = json.JSONEncoder(indent=2, default=repr)
+_ORJSON_DEBUG_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _json_dumps(value: Any) -> bytes:
+  """Encodes ``value`` as compact UTF-8 JSON."""
+  if orjson is not None:
+    return orjson.dumps(value)
+  return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+  """Decodes a JSON document.
+
+  Raises:
+    ValueError: If ``data`` is not valid JSON (``orjson.JSONDecodeError``
+      and ``json.JSONDecodeError`` both subclass it).
+  """
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def _retrieve_payload(
+    query: str, space_ids: List[str], request_size: int
+) -> Dict[str, Any]:
+  """Builds the request body for ``POST /v1/memories:retrieve``."""
+  return {
+      "message": query,
+      "spaceKeys": [{"spaceId": sid} for sid in space_ids],
+      "requestedSize": request_size,
+  }
+
+
+# Canonical hyphenated UUIDs contain no characters ``quote`` would escape.
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+    r"-[0-9a-fA-F]{12}\Z"
+)
+
+
+def _quote_id(resource_id: str) -> str:
+  """Percent-encodes an ID for use as a URL path segment.
+
+  Server-generated IDs are UUIDs, which are returned unchanged without
+  going through ``quote``.
+  """
+  if _UUID_RE.match(resource_id):
+    return resource_id
+  return quote(resource_id, safe="")
+
+
+def _split_ids(ids: List[str], chunk_size: int) -> List[List[str]]:
+  """Splits ``ids`` into consecutive lists of at most ``chunk_size``."""
+  ids = list(ids)
+  return [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+
+
+def _list_spaces_params(
+    name: Optional[str], next_token: Optional[str]
+) -> Dict[str, Any]:
+  """Builds the query parameters for one ``GET /v1/spaces`` page."""
+  params: Dict[str, Any] = {"maxResults": 1000}
+  if next_token:
+    params["nextToken"] = next_token
+  if name:
+    params["nameFilter"] = name
+  return params
+
+
+def _parse_ndjson_chunk(line: str) -> Optional[Dict[str, Any]]:
+  """Parses one retrieve NDJSON line, keeping only ``retrievedItem`` lines."""
+  if not line.strip():
+    return None
+  try:
+    tmp_dict = _json_loads(line)
+  except ValueError:
+    return None
+  if "retrievedItem" in tmp_dict:
+    return tmp_dict
+  return None
+
+
+def _memory_payload(
+    space_id: str,
+    content: str,
+    content_type: str,
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+  """Builds the request body for a text ``POST /v1/memories``."""
+  payload: Dict[str, Any] = {
+      "spaceId": space_id,
+      "originalContent": content,
+      "contentType": content_type,
+  }
+  if metadata:
+    payload["metadata"] = metadata
+  return payload
+
+
+def _binary_request_data(
+    space_id: str, content_type: str, metadata: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+  """Builds the ``request`` form field for a multipart memory upload."""
+  request_data: Dict[str, Any] = {
+      "spaceId": space_id,
+      "contentType": content_type,
+  }
+  if metadata:
+    request_data["metadata"] = metadata
+  return request_data
+
+
+def _upload_file(content: Union[bytes, BinaryIO]) -> BinaryIO:
+  """Returns a file object httpx can stream as the multipart file part."""
+  return io.BytesIO(content) if isinstance(content, bytes) else content
+
+
+def _google_api_key() -> str:
+  """Returns the API key used to auto-create the Google embedder.
+
+  Raises:
+    ValueError: If neither ``GOOGLE_API_KEY`` nor ``GEMINI_API_KEY`` is set.
+  """
+  google_api_key = (
+      os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+  )
+  if not google_api_key:
+    raise ValueError(
+        "No embedders available in Goodmem and neither GOOGLE_API_KEY "
+        "nor GEMINI_API_KEY is set. Please create an embedder manually "
+        "or set one of these environment variables to auto-create a "
+        "Google Gemini embedder."
+    )
+  return google_api_key
+
+
+def _select_embedder_id(
+    embedders: List[Dict[str, Any]],
+    embedder_id: Optional[str],
+    debug: bool,
+) -> Optional[str]:
+  """Picks an embedder ID from a ``list_embedders`` result.
+
+  Returns ``None`` when no embedder is requested and none exist, in which
+  case the caller is expected to auto-create one.
+
+  Raises:
+    ValueError: If ``embedder_id`` is set but not in ``embedders``.
+  """
+  if embedder_id is not None:
+    valid_ids = [e.get("embedderId") for e in embedders]
+    if embedder_id in valid_ids:
+      return embedder_id
+    raise ValueError(
+        f"GOODMEM_EMBEDDER_ID '{embedder_id}' not found. "
+        f"Available embedders: {valid_ids}"
+    )
+
+  if embedders:
+    eid = embedders[0].get("embedderId")
+    if eid:
+      if debug:
+        print(f"[DEBUG] Using existing embedder: {eid}")
+      return eid
+  return None
+
+
+async def fanout_retrieve(
+    client: Union["GoodmemClient", "GoodmemAsyncClient"],
+    query: str,
+    space_ids: List[str],
+    request_size: int = 5,
+) -> List[Dict[str, Any]]:
+  """Retrieves from several spaces concurrently, one request per space.
+
+  Wall-clock time is bounded by the slowest space rather than the sum of
+  all of them. Unlike a single multi-space :meth:`GoodmemClient.retrieve_memories`
+  call, ``request_size`` applies per space and results are not re-ranked
+  across spaces; they are concatenated in ``space_ids`` order.
+
+  Args:
+    client: The Goodmem client to use.
+    query: The search query message.
+    space_ids: List of space IDs to search in.
+    request_size: The number of chunks to retrieve from each space.
+
+  Returns:
+    List of matching chunks from all spaces.
+  """
+  results = await asyncio.gather(
+      *[
+          client.aretrieve_memories(query, [sid], request_size=request_size)
+          for sid in space_ids
+      ]
+  )
+  return [chunk for chunks in results for chunk in chunks]
+
+
+# (query as sent, sorted space IDs, request_size)
+_RetrievalKey = Tuple[str, Tuple[str, ...], int]
+# (time.monotonic() when stored, chunks)
+_CachedRetrieval = Tuple[float, List[Dict[str, Any]]]
+
+
+class _RetrievalCache:
+  """Thread-safe LRU of ``retrieve_memories`` results with a TTL.
+
+  One instance is shared by a ``GoodmemClient`` and its
+  ``GoodmemAsyncClient`` so both surfaces hit the same entries. Results are
+  deep-copied in and out, so callers may mutate what they get back.
+  """
+
+  def __init__(self, max_size: int, ttl: float) -> None:
+    self._entries: "OrderedDict[_RetrievalKey, _CachedRetrieval]" = (
+        OrderedDict()
+    )
+    self._max_size = max_size
+    self._ttl = ttl
+    self._lock = Lock()
+
+  def get(self, key: _RetrievalKey) -> Optional[List[Dict[str, Any]]]:
+    """Returns a fresh cached retrieval result, or ``None`` on a miss."""
+    if self._max_size <= 0:
+      return None
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      stored_at, chunks = entry
+      if time.monotonic() - stored_at > self._ttl:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+      return copy.deepcopy(chunks)
+
+  def put(self, key: _RetrievalKey, chunks: List[Dict[str, Any]]) -> None:
+    """Stores a retrieval result with simple LRU eviction."""
+    if self._max_size <= 0:
+      return
+    with self._lock:
+      self._entries[key] = (time.monotonic(), copy.deepcopy(chunks))
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+
+  def invalidate_space(self, space_id: str) -> None:
+    """Drops cached retrievals that searched ``space_id``."""
+    with self._lock:
+      stale = [k for k in self._entries if space_id in k[1]]
+      for key in stale:
+        del self._entries[key]
+
+  def clear(self) -> None:
+    """Drops all cached results."""
+    with self._lock:
+      self._entries.clear()
+
+
+class _Request(NamedTuple):
+  """One HTTP request of a client flow, sent by either transport."""
+
+  # Name of the ``httpx.Client`` / ``httpx.AsyncClient`` method to call.
+  method: str
+  url: str
+  kwargs: Dict[str, Any]
+  # Send as a streamed ``POST`` and hand the flow the parsed NDJSON chunks
+  # instead of the response.
+  ndjson: bool = False
+
+
+_T = TypeVar("_T")
+# The request building and response parsing of one API call, written once
+# for both clients: the flow yields each request it needs, is sent back the
+# response, and returns the call's result. ``GoodmemClient._run`` and
+# ``GoodmemAsyncClient._arun`` only differ in how they send the request.
+_Flow = Generator[_Request, Any, _T]
+
+
+class _SharedState:
+  """Caches shared by a ``GoodmemClient`` and its ``GoodmemAsyncClient``."""
+
+  def __init__(self, retrieval_cache_size: int, retrieval_cache_ttl: float):
+    self.retrieval_cache = _RetrievalCache(
+        retrieval_cache_size, retrieval_cache_ttl
+    )
+    # Embedder resolved by ``ensure_embedder``; embedders change rarely, so
+    # it is kept for the client's lifetime (see invalidate_embedder_cache).
+    self.embedder_id: Optional[str] = None
+
+
+def _json_object(response: httpx.Response) -> Dict[str, Any]:
+  """Decodes a JSON object response body."""
+  data: Dict[str, Any] = _json_loads(response.content)
+  return data
+
+
+def _json_list(response: httpx.Response, field: str) -> List[Dict[str, Any]]:
+  """Decodes the list under ``field`` of a JSON object response body."""
+  items: List[Dict[str, Any]] = _json_object(response).get(field, [])
+  return items
+
+
+def _google_embedder_kwargs(debug: bool) -> Dict[str, Any]:
+  """Builds the ``create_embedder`` arguments for the auto-created embedder.
+
+  Raises:
+    ValueError: If neither ``GOOGLE_API_KEY`` nor ``GEMINI_API_KEY`` is set.
+  """
+  base = _GoodmemClientBase
+  if debug:
+    print(
+        "[DEBUG] No embedders found. Auto-creating Google Gemini embedder "
+        f"({base._GOOGLE_EMBEDDER_MODEL_ID}) using GOOGLE_API_KEY"
+    )
+  return {
+      "display_name": base._GOOGLE_EMBEDDER_DISPLAY_NAME,
+      "provider_type": base._GOOGLE_EMBEDDER_PROVIDER_TYPE,
+      "endpoint_url": base._GOOGLE_EMBEDDER_ENDPOINT_URL,
+      "model_identifier": base._GOOGLE_EMBEDDER_MODEL_ID,
+      "dimensionality": base._GOOGLE_EMBEDDER_DIMENSIONALITY,
+      "api_key": _google_api_key(),
+      "distribution_type": base._GOOGLE_EMBEDDER_DISTRIBUTION_TYPE,
+  }
+
+
+def _created_embedder_id(response: Dict[str, Any], debug: bool) -> str:
+  """Returns the ID from a ``create_embedder`` response for the auto-created
+  embedder.
+
+  Raises:
+    ValueError: If the response carries no ``embedderId``.
+  """
+  new_id: Optional[str] = response.get("embedderId")
+  if not new_id:
+    raise ValueError(
+        "Failed to auto-create Google embedder: no embedderId in response"
+    )
+  if debug:
+    print(f"[DEBUG] Auto-created Google embedder: {new_id}")
+  return new_id
+
+
+class _GoodmemClientBase:
+  """Configuration, caches and per-call flows shared by both clients.
+
+  Each API call is implemented once as a ``_*_flow`` generator (see
+  ``_Flow``); the subclasses only supply the transport.
+  """
+
+  # Chunking config sent with every ``create_space``. Read-only because it is
+  # shared by all instances; each payload gets its own plain-dict copy, which
+  # the JSON encoders can serialize.
+  _DEFAULT_CHUNKING_CONFIG: ClassVar[Mapping[str, Mapping[str, Any]]] = (
+      MappingProxyType({
+          "recursive": MappingProxyType({
+              "chunkSize": 512,
+              "chunkOverlap": 64,
+              "keepStrategy": "KEEP_END",
+              "lengthMeasurement": "CHARACTER_COUNT",
+          }),
+      })
+  )
+  _CREDENTIAL_KIND_API_KEY = "CREDENTIAL_KIND_API_KEY"
+
+  # Default Google embedder configuration
+  _GOOGLE_EMBEDDER_DISPLAY_NAME = "gemini-embedding-001"
+  _GOOGLE_EMBEDDER_PROVIDER_TYPE = "OPENAI"
+  _GOOGLE_EMBEDDER_ENDPOINT_URL = (
+      "https://generativelanguage.googleapis.com/v1beta/openai"
+  )
+  _GOOGLE_EMBEDDER_MODEL_ID = "gemini-embedding-001"
+  _GOOGLE_EMBEDDER_DIMENSIONALITY = 1536
+  _GOOGLE_EMBEDDER_DISTRIBUTION_TYPE = "DENSE"
+
+  def __init__(
+      self, base_url: str, api_key: str, debug: bool, state: _SharedState
+  ) -> None:
+    self._base_url = base_url.rstrip("/")
+    self._api_key = api_key.strip()
+    self._headers = {"x-api-key": self._api_key}
+    self._debug = debug
+    self._state = state
+    self._retrieval_cache = state.retrieval_cache
+
+  @property
+  def _embedder_id_cache(self) -> Optional[str]:
+    return self._state.embedder_id
+
+  @_embedder_id_cache.setter
+  def _embedder_id_cache(self, value: Optional[str]) -> None:
+    self._state.embedder_id = value
+
+  def clear_retrieval_cache(self) -> None:
+    """Drops all cached retrieval results."""
+    self._retrieval_cache.clear()
+
+  def invalidate_embedder_cache(self) -> None:
+    """Forgets the embedder ID remembered by ``ensure_embedder``."""
+    self._embedder_id_cache = None
+
+  def _safe_json_dumps(self, value: Any) -> str:
+    """Pretty-prints ``value`` for debug output; never raises on odd types."""
+    try:
+      if orjson is not None:
+        return orjson.dumps(
+            value, default=repr, option=_ORJSON_DEBUG_OPTIONS
+        ).decode()
+      return _DEBUG_ENCODER.encode(value)
+    except (TypeError, ValueError):
+      # Circular references and other structural errors.
+      return f"<non-serializable: {type(value).__name__}>"
+
+  def _embedder_payload(
+      self,
+      display_name: str,
+      provider_type: str,
+      endpoint_url: str,
+      model_identifier: str,
+      dimensionality: int,
+      api_key: str,
+      distribution_type: str,
+      embedder_id: Optional[str],
+  ) -> Dict[str, Any]:
+    """Builds the request body for ``POST /v1/embedders``."""
+    payload: Dict[str, Any] = {
+        "displayName": display_name,
+        "providerType": provider_type,
+        "endpointUrl": endpoint_url,
+        "modelIdentifier": model_identifier,
+        "dimensionality": dimensionality,
+        "distributionType": distribution_type,
+        "credentials": {
+            "kind": self._CREDENTIAL_KIND_API_KEY,
+            "apiKey": {
+                "inlineSecret": api_key,
+            },
+        },
+    }
+    if embedder_id is not None:
+      payload["embedderId"] = embedder_id
+    return payload
+
+  # -- flows -----------------------------------------------------------------
+
+  def _get_space_flow(self, space_id: str) -> _Flow[Optional[Dict[str, Any]]]:
+    response = yield _Request("get", f"/v1/spaces/{_quote_id(space_id)}", {})
+    if response.status_code == 404:
+      return None
+    response.raise_for_status()
+    return _json_object(response)
+
+  def _create_space_flow(
+      self, space_name: str, embedder_id: str, space_id: Optional[str]
+  ) -> _Flow[Dict[str, Any]]:
+    payload: Dict[str, Any] = {
+        "name": space_name,
+        "spaceEmbedders": [
+            {"embedderId": embedder_id, "defaultRetrievalWeight": 1.0}
+        ],
+        "defaultChunkingConfig": {
+            strategy: dict(options)
+            for strategy, options in self._DEFAULT_CHUNKING_CONFIG.items()
+        },
+    }
+    if space_id is not None:
+      payload["spaceId"] = space_id
+    response = yield _Request(
+        "post",
+        "/v1/spaces",
+        {"content": _json_dumps(payload), "headers": _JSON_HEADERS},
+    )
+    response.raise_for_status()
+    return _json_object(response)
+
+  def _delete_space_flow(self, space_id: str) -> _Flow[None]:
+    response = yield _Request(
+        "delete", f"/v1/spaces/{_quote_id(space_id)}", {}
+    )
+    response.raise_for_status()
+    self._retrieval_cache.invalidate_space(space_id)
+
+  def _insert_memory_flow(
+      self,
+      space_id: str,
+      content: str,
+      content_type: str,
+      metadata: Optional[Dict[str, Any]],
+  ) -> _Flow[Dict[str, Any]]:
+    payload = _memory_payload(space_id, content, content_type, metadata)
+    response = yield _Request(
+        "post",
+        "/v1/memories",
+        {"content": _json_dumps(payload), "headers": _JSON_HEADERS},
+    )
+    response.raise_for_status()
+    self._retrieval_cache.invalidate_space(space_id)
+    return _json_object(response)
+
+  def _insert_memory_binary_flow(
+      self,
+      space_id: str,
+      content_bytes: Union[bytes, BinaryIO],
+      content_type: str,
+      metadata: Optional[Dict[str, Any]],
+  ) -> _Flow[Dict[str, Any]]:
+    url = "/v1/memories"
+    request_data = _binary_request_data(space_id, content_type, metadata)
+
+    # One guard for all pre-request output; request_data already carries the
+    # metadata, so it is only encoded for debug output once.
+    if self._debug:
+      if isinstance(content_bytes, bytes):
+        size = f"{len(content_bytes)} bytes"
+      else:
+        size = "file object (streamed)"
+      print(
+          "[DEBUG] insert_memory_binary called:\n"
+          f"  - space_id: {space_id}\n"
+          f"  - content_type: {content_type}\n"
+          f"  - content_bytes length: {size}\n"
+          f"[DEBUG] request_data:\n{self._safe_json_dumps(request_data)}\n"
+          f"[DEBUG] Making POST request to {url}"
+      )
+
+    data = {"request": _json_dumps(request_data).decode()}
+    files = {"file": ("upload", _upload_file(content_bytes), content_type)}
+
+    response = yield _Request(
+        "post",
+        url,
+        {"data": data, "files": files, "timeout": _UPLOAD_TIMEOUT},
+    )
+    if self._debug:
+      print(f"[DEBUG] Response status: {response.status_code}")
+
+    response.raise_for_status()
+    self._retrieval_cache.invalidate_space(space_id)
+    result = _json_object(response)
+    if self._debug:
+      print(f"[DEBUG] Response:\n{self._safe_json_dumps(result)}")
+    return result
+
+  def _retrieve_memories_flow(
+      self, query: str, space_ids: List[str], request_size: int
+  ) -> _Flow[List[Dict[str, Any]]]:
+    key = (query, tuple(sorted(space_ids)), request_size)
+    cached = self._retrieval_cache.get(key)
+    if cached is not None:
+      return cached
+
+    headers = {
+        **self._headers,
+        **_JSON_HEADERS,
+        "Accept": "application/x-ndjson",
+    }
+    payload = _retrieve_payload(query, space_ids, request_size)
+    chunks: List[Dict[str, Any]] = yield _Request(
+        "stream",
+        "/v1/memories:retrieve",
+        {"content": _json_dumps(payload), "headers": headers},
+        ndjson=True,
+    )
+    self._retrieval_cache.put(key, chunks)
+    return chunks
+
+  def _list_spaces_request(
+      self, name: Optional[str], next_token: Optional[str]
+  ) -> _Request:
+    return _Request(
+        "get",
+        "/v1/spaces",
+        {"params": _list_spaces_params(name, next_token)},
+    )
+
+  def _list_spaces_flow(
+      self, name: Optional[str]
+  ) -> _Flow[List[Dict[str, Any]]]:
+    all_spaces: List[Dict[str, Any]] = []
+    next_token: Optional[str] = None
+
+    while True:
+      response = yield self._list_spaces_request(name, next_token)
+      response.raise_for_status()
+
+      data = _json_object(response)
+      all_spaces.extend(data.get("spaces", []))
+
+      next_token = data.get("nextToken")
+      if not next_token:
+        break
+
+    return all_spaces
+
+  def _list_embedders_flow(self) -> _Flow[List[Dict[str, Any]]]:
+    response = yield _Request("get", "/v1/embedders", {})
+    response.raise_for_status()
+    return _json_list(response, "embedders")
+
+  def _create_embedder_flow(
+      self,
+      display_name: str,
+      provider_type: str,
+      endpoint_url: str,
+      model_identifier: str,
+      dimensionality: int,
+      api_key: str,
+      distribution_type: str,
+      embedder_id: Optional[str],
+  ) -> _Flow[Dict[str, Any]]:
+    payload = self._embedder_payload(
+        display_name, provider_type, endpoint_url, model_identifier,
+        dimensionality, api_key, distribution_type, embedder_id,
+    )
+    response = yield _Request(
+        "post",
+        "/v1/embedders",
+        {"content": _json_dumps(payload), "headers": _JSON_HEADERS},
+    )
+    response.raise_for_status()
+    return _json_object(response)
+
+  def _get_memory_flow(self, memory_id: str) -> _Flow[Optional[Dict[str, Any]]]:
+    memories = yield from self._memories_chunk_flow([memory_id])
+    for memory in memories:
+      if memory.get("memoryId") == memory_id:
+        return memory
+    return None
+
+  def _memories_chunk_flow(
+      self, memory_ids: List[str]
+  ) -> _Flow[List[Dict[str, Any]]]:
+    """Sends one ``POST /v1/memories:batchGet`` request."""
+    payload = {"memoryIds": memory_ids}
+    response = yield _Request(
+        "post",
+        "/v1/memories:batchGet",
+        {"content": _json_dumps(payload), "headers": _JSON_HEADERS},
+    )
+    response.raise_for_status()
+    return _json_list(response, "memories")
+
+
+class GoodmemAsyncClient(_GoodmemClientBase):
+  """Asyncio-native client for the Goodmem API.
+
+  Shares request building and response parsing with :class:`GoodmemClient`,
+  so both surfaces send identical requests. Use it directly from async code,
+  or reach the instance owned by a sync client through
+  :attr:`GoodmemClient.async_client` to share its caches.
+
+  Attributes:
+    _base_url: The base URL for the Goodmem API.
+    _api_key: The API key for authentication.
+    _headers: HTTP headers for API requests.
+  """
+
+  def __init__(
+      self,
+      base_url: str,
+      api_key: str,
+      debug: bool = False,
+      retrieval_cache_size: int = 0,
+      retrieval_cache_ttl: float = 60.0,
+      *,
+      _state: Optional[_SharedState] = None,
+  ) -> None:
+    """Initializes the async Goodmem client.
+
+    Creating it makes no network calls; connections are opened on first use.
+    Arguments are the same as for :class:`GoodmemClient`; ``_state`` is set
+    by a sync client to share its caches, and overrides the cache arguments.
+    """
+    super().__init__(
+        base_url,
+        api_key,
+        debug,
+        _state or _SharedState(retrieval_cache_size, retrieval_cache_ttl),
+    )
+    self._aclient = httpx.AsyncClient(
+        base_url=self._base_url,
+        headers=self._headers,
+        timeout=_DEFAULT_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True, limits=_POOL_LIMITS, retries=2
+        ),
+    )
+
+  async def aclose(self) -> None:
+    """Closes the underlying HTTP client."""
+    await self._aclient.aclose()
+
+  async def __aenter__(self) -> "GoodmemAsyncClient":
+    return self
+
+  async def __aexit__(self, *args: Any) -> None:
+    await self.aclose()
+
+  async def _asend(self, request: _Request) -> Any:
+    """Sends one flow request on the async client."""
+    if request.ndjson:
+      async with self._aclient.stream(
+          "POST", request.url, **request.kwargs
+      ) as response:
+        if response.is_error:
+          await response.aread()
+        response.raise_for_status()
+        return [
+            chunk
+            async for line in response.aiter_lines()
+            if (chunk := _parse_ndjson_chunk(line)) is not None
+        ]
+    send = getattr(self._aclient, request.method)
+    return await send(request.url, **request.kwargs)
+
+  async def _arun(self, flow: _Flow[_T]) -> _T:
+    """Drives ``flow`` to completion, sending each request it yields."""
+    try:
+      request = next(flow)
+      while True:
+        request = flow.send(await self._asend(request))
+    except StopIteration as done:
+      result: _T = done.value
+      return result
+
+  async def aget_space(self, space_id: str) -> Optional[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.get_space`."""
+    return await self._arun(self._get_space_flow(space_id))
+
+  async def acreate_space(
+      self,
+      space_name: str,
+      embedder_id: str,
+      space_id: Optional[str] = None,
+  ) -> Dict[str, Any]:
+    """Async version of :meth:`GoodmemClient.create_space`."""
+    return await self._arun(
+        self._create_space_flow(space_name, embedder_id, space_id)
+    )
+
+  async def adelete_space(self, space_id: str) -> None:
+    """Async version of :meth:`GoodmemClient.delete_space`."""
+    await self._arun(self._delete_space_flow(space_id))
 
-class GoodmemClient:
+  async def ainsert_memory(
+      self,
+      space_id: str,
+      content: str,
+      content_type: str = "text/plain",
+      metadata: Optional[Dict[str, Any]] = None,
+  ) -> Dict[str, Any]:
+    """Async version of :meth:`GoodmemClient.insert_memory`."""
+    return await self._arun(
+        self._insert_memory_flow(space_id, content, content_type, metadata)
+    )
+
+  async def ainsert_memory_binary(
+      self,
+      space_id: str,
+      content_bytes: Union[bytes, BinaryIO],
+      content_type: str,
+      metadata: Optional[Dict[str, Any]] = None,
+  ) -> Dict[str, Any]:
+    """Async version of :meth:`GoodmemClient.insert_memory_binary`.
+
+    A file object passed as ``content_bytes`` is read synchronously while
+    the request body is sent.
+    """
+    return await self._arun(
+        self._insert_memory_binary_flow(
+            space_id, content_bytes, content_type, metadata
+        )
+    )
+
+  async def aretrieve_memories(
+      self,
+      query: str,
+      space_ids: List[str],
+      request_size: int = 5,
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.retrieve_memories`."""
+    return await self._arun(
+        self._retrieve_memories_flow(query, space_ids, request_size)
+    )
+
+  async def aiter_spaces(
+      self, name: Optional[str] = None
+  ) -> AsyncIterator[Dict[str, Any]]:
+    """Yields spaces page by page, prefetching the next page.
+
+    Each page needs the previous page's ``nextToken``, so pages cannot be
+    fetched concurrently. Instead, the request for page ``n + 1`` is in
+    flight while the caller consumes page ``n``. Breaking out of the loop
+    early cancels the outstanding request.
+
+    Raises:
+      httpx.HTTPStatusError: If the API request fails with an error status.
+      httpx.RequestError: If the request fails.
+    """
+
+    def fetch(next_token: Optional[str]) -> "asyncio.Task[httpx.Response]":
+      request = self._list_spaces_request(name, next_token)
+      return asyncio.ensure_future(self._asend(request))
+
+    pending: Optional["asyncio.Task[httpx.Response]"] = fetch(None)
+    try:
+      while pending is not None:
+        response = await pending
+        pending = None
+        response.raise_for_status()
+
+        data = _json_object(response)
+        next_token = data.get("nextToken")
+        if next_token:
+          pending = fetch(next_token)
+        for space in data.get("spaces", []):
+          yield space
+    finally:
+      if pending is not None:
+        pending.cancel()
+        # Wait for the cancellation so the request is not left running
+        # unobserved after the iterator is closed.
+        with contextlib.suppress(asyncio.CancelledError):
+          await pending
+
+  async def alist_spaces(
+      self, name: Optional[str] = None
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.list_spaces`."""
+    return await self._arun(self._list_spaces_flow(name))
+
+  async def alist_embedders(self) -> List[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.list_embedders`."""
+    return await self._arun(self._list_embedders_flow())
+
+  async def acreate_embedder(
+      self,
+      display_name: str,
+      provider_type: str,
+      endpoint_url: str,
+      model_identifier: str,
+      dimensionality: int,
+      api_key: str,
+      distribution_type: str = "DENSE",
+      embedder_id: Optional[str] = None,
+  ) -> Dict[str, Any]:
+    """Async version of :meth:`GoodmemClient.create_embedder`."""
+    return await self._arun(
+        self._create_embedder_flow(
+            display_name, provider_type, endpoint_url, model_identifier,
+            dimensionality, api_key, distribution_type, embedder_id,
+        )
+    )
+
+  async def aget_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.get_memory`."""
+    return await self._arun(self._get_memory_flow(memory_id))
+
+  async def aget_memories_batch(
+      self, memory_ids: List[str], chunk_size: int = 100
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`GoodmemClient.get_memories_batch` (chunks via ``gather``)."""
+    chunks = _split_ids(memory_ids, chunk_size)
+    results = await asyncio.gather(
+        *[self._arun(self._memories_chunk_flow(chunk)) for chunk in chunks]
+    )
+    return [memory for memories in results for memory in memories]
+
+  async def aensure_embedder(
+      self,
+      embedder_id: Optional[str] = None,
+      debug: bool = False,
+  ) -> str:
+    """Async version of :meth:`GoodmemClient.ensure_embedder`."""
+    if embedder_id is None and self._embedder_id_cache is not None:
+      return self._embedder_id_cache
+
+    embedders = await self.alist_embedders()
+    eid = _select_embedder_id(embedders, embedder_id, debug)
+    if eid is None:
+      eid = await self._aauto_create_google_embedder(debug=debug)
+    self._embedder_id_cache = eid
+    return eid
+
+  async def _aauto_create_google_embedder(self, debug: bool = False) -> str:
+    """Async version of :meth:`GoodmemClient._auto_create_google_embedder`."""
+    response = await self.acreate_embedder(**_google_embedder_kwargs(debug))
+    return _created_embedder_id(response, debug)
+
+
+class GoodmemClient(_GoodmemClientBase):
   """Client for interacting with the Goodmem API.
 
+  Methods block; the ``a``-prefixed coroutines delegate to the
+  :class:`GoodmemAsyncClient` available as :attr:`async_client`. The sync
+  methods deliberately keep their own ``httpx.Client`` instead of driving
+  the async client through an event loop: ADK invokes them from inside a
+  running loop, where ``asyncio.run`` is not allowed. Both run the same
+  request flows, so only the transport differs.
+
   Attributes:
     _base_url: The base URL for the Goodmem API.
     _api_key: The API key for authentication.
     _headers: HTTP headers for API requests.
   """
 
-  def __init__(self, base_url: str, api_key: str, debug: bool = False) -> None:
+  def __init__(
+      self,
+      base_url: str,
+      api_key: str,
+      debug: bool = False,
+      retrieval_cache_size: int = 0,
+      retrieval_cache_ttl: float = 60.0,
+      warmup: bool = False,
+  ) -> None:
     """Initializes the Goodmem client.
 
     Args:
@@ -44,20 +1011,102 @@ class GoodmemClient:
         (e.g., "https://api.goodmem.ai").
       api_key: The Goodmem API key for authentication.
       debug: Whether to enable debug mode.
+      retrieval_cache_size: Maximum number of ``retrieve_memories`` results
+        kept in the in-process LRU cache. ``0`` (the default) disables
+        caching.
+      retrieval_cache_ttl: Seconds a cached retrieval result stays valid.
+        Inserts through this client invalidate affected entries right away;
+        the TTL bounds staleness from writes made elsewhere.
+      warmup: Whether to open a pooled connection right away (see
+        :meth:`warm_up`). Off by default so that constructing a client
+        makes no network calls.
     """
-    self._base_url = base_url.rstrip("/")
-    self._api_key = api_key.strip()
-    self._headers = {"x-api-key": self._api_key}
-    self._debug = debug
+    super().__init__(
+        base_url,
+        api_key,
+        debug,
+        _SharedState(retrieval_cache_size, retrieval_cache_ttl),
+    )
+    # Built on first use of an ``a``-prefixed method, so sync-only callers
+    # never open an async connection pool.
+    self._async: Optional[GoodmemAsyncClient] = None
+    self._async_lock = Lock()
+    # Close of the async client scheduled by ``close`` on a running loop.
+    self._async_closing: Optional["asyncio.Task[None]"] = None
+    # HTTP/2 multiplexes concurrent callback requests over one connection
+    # and falls back to HTTP/1.1 when the server does not negotiate h2.
+    # ``retries`` only re-attempts failed connects, never sent requests.
     self._client = httpx.Client(
         base_url=self._base_url,
         headers=self._headers,
-        timeout=30.0,
+        timeout=_DEFAULT_TIMEOUT,
+        transport=httpx.HTTPTransport(
+            http2=True, limits=_POOL_LIMITS, retries=2
+        ),
     )
+    if warmup:
+      self.warm_up()
+
+  @property
+  def async_client(self) -> GoodmemAsyncClient:
+    """The async client sharing this client's caches and configuration.
+
+    Created on first access; :meth:`close` and :meth:`aclose` close it too.
+    """
+    with self._async_lock:
+      if self._async is None:
+        self._async = GoodmemAsyncClient(
+            self._base_url, self._api_key, debug=self._debug,
+            _state=self._state,
+        )
+      return self._async
+
+  def warm_up(self) -> None:
+    """Opens a pooled connection so the first real call skips the handshake.
+
+    Sends a cheap ``HEAD /v1/embedders`` on the sync client. The response
+    status is ignored and connection errors are swallowed: a failed warm-up
+    just means the first real request pays the connection cost as usual.
+    """
+    try:
+      self._client.head("/v1/embedders")
+    except httpx.HTTPError as e:
+      if self._debug:
+        print(f"[DEBUG] Connection warm-up failed: {e}")
+
+  def _take_async(self) -> Optional[GoodmemAsyncClient]:
+    """Detaches the async client, if one was created, for closing."""
+    with self._async_lock:
+      async_client, self._async = self._async, None
+    return async_client
 
   def close(self) -> None:
-    """Closes the underlying HTTP client."""
+    """Closes the sync HTTP client and the async one, if it was created.
+
+    Called from inside a running event loop, the async client's close is
+    scheduled on that loop (the loop its connections belong to) instead of
+    awaited; prefer :meth:`aclose` there.
+    """
+    self._client.close()
+    async_client = self._take_async()
+    if async_client is None:
+      return
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      # Connections opened on a loop that ``asyncio.run`` has since closed
+      # cannot be shut down through it; the client is still marked closed.
+      with contextlib.suppress(RuntimeError):
+        asyncio.run(async_client.aclose())
+    else:
+      self._async_closing = loop.create_task(async_client.aclose())
+
+  async def aclose(self) -> None:
+    """Closes both the sync and the async HTTP clients."""
     self._client.close()
+    async_client = self._take_async()
+    if async_client is not None:
+      await async_client.aclose()
 
   def __enter__(self) -> "GoodmemClient":
     return self
@@ -65,11 +1114,41 @@ class GoodmemClient:
   def __exit__(self, *args: Any) -> None:
     self.close()
 
-  def _safe_json_dumps(self, value: Any) -> str:
+  async def __aenter__(self) -> "GoodmemClient":
+    return self
+
+  async def __aexit__(self, *args: Any) -> None:
+    await self.aclose()
+
+  def _send(self, request: _Request) -> Any:
+    """Sends one flow request on the sync client."""
+    if request.ndjson:
+      # Stream the body so each line is decoded as it arrives instead of
+      # buffering the whole NDJSON response in memory first.
+      with self._client.stream(
+          "POST", request.url, **request.kwargs
+      ) as response:
+        if response.is_error:
+          # Load the body so callers can still read e.response.text.
+          response.read()
+        response.raise_for_status()
+        return [
+            chunk
+            for line in response.iter_lines()
+            if (chunk := _parse_ndjson_chunk(line)) is not None
+        ]
+    send = getattr(self._client, request.method)
+    return send(request.url, **request.kwargs)
+
+  def _run(self, flow: _Flow[_T]) -> _T:
+    """Drives ``flow`` to completion, sending each request it yields."""
     try:
-      return json.dumps(value, indent=2)
-    except (TypeError, ValueError):
-      return f"<non-serializable: {type(value).__name__}>"
+      request = next(flow)
+      while True:
+        request = flow.send(self._send(request))
+    except StopIteration as done:
+      result: _T = done.value
+      return result
 
   def get_space(self, space_id: str) -> Optional[Dict[str, Any]]:
     """Gets a space by its ID.
@@ -84,13 +1163,7 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with a non-404 error.
       httpx.RequestError: If the request fails (e.g. connection, timeout).
     """
-    encoded_space_id = quote(space_id, safe="")
-    url = f"/v1/spaces/{encoded_space_id}"
-    response = self._client.get(url, timeout=30.0)
-    if response.status_code == 404:
-      return None
-    response.raise_for_status()
-    return response.json()
+    return self._run(self._get_space_flow(space_id))
 
   def create_space(
       self,
@@ -113,26 +1186,21 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails (e.g. connection, timeout).
     """
-    url = "/v1/spaces"
-    payload: Dict[str, Any] = {
-        "name": space_name,
-        "spaceEmbedders": [
-            {"embedderId": embedder_id, "defaultRetrievalWeight": 1.0}
-        ],
-        "defaultChunkingConfig": {
-            "recursive": {
-                "chunkSize": 512,
-                "chunkOverlap": 64,
-                "keepStrategy": "KEEP_END",
-                "lengthMeasurement": "CHARACTER_COUNT",
-            }
-        },
-    }
-    if space_id is not None:
-      payload["spaceId"] = space_id
-    response = self._client.post(url, json=payload, timeout=30.0)
-    response.raise_for_status()
-    return response.json()
+    return self._run(
+        self._create_space_flow(space_name, embedder_id, space_id)
+    )
+
+  def delete_space(self, space_id: str) -> None:
+    """Deletes a space and all of its memories.
+
+    Args:
+      space_id: The ID of the space to delete.
+
+    Raises:
+      httpx.HTTPStatusError: If the API request fails with an error status.
+      httpx.RequestError: If the request fails (e.g. connection, timeout).
+    """
+    self._run(self._delete_space_flow(space_id))
 
   def insert_memory(
       self,
@@ -156,30 +1224,26 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/memories"
-    payload: Dict[str, Any] = {
-        "spaceId": space_id,
-        "originalContent": content,
-        "contentType": content_type,
-    }
-    if metadata:
-      payload["metadata"] = metadata
-    response = self._client.post(url, json=payload, timeout=30.0)
-    response.raise_for_status()
-    return response.json()
+    return self._run(
+        self._insert_memory_flow(space_id, content, content_type, metadata)
+    )
 
   def insert_memory_binary(
       self,
       space_id: str,
-      content_bytes: bytes,
+      content_bytes: Union[bytes, BinaryIO],
       content_type: str,
       metadata: Optional[Dict[str, Any]] = None,
   ) -> Dict[str, Any]:
     """Inserts a binary memory into a Goodmem space using multipart upload.
 
+    The file part is streamed from a file-like object, so passing an open
+    binary file uploads it without loading it into memory first.
+
     Args:
       space_id: The ID of the space to insert into.
-      content_bytes: The raw binary content as bytes.
+      content_bytes: The raw binary content, as bytes or as a readable
+        binary file object positioned at the start of the content.
       content_type: The MIME type (e.g., application/pdf, image/png).
       metadata: Optional metadata dict (e.g., session_id, user_id, filename).
 
@@ -190,45 +1254,11 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/memories"
-
-    if self._debug:
-      print("[DEBUG] insert_memory_binary called:")
-      print(f"  - space_id: {space_id}")
-      print(f"  - content_type: {content_type}")
-      print(f"  - content_bytes length: {len(content_bytes)} bytes")
-      if metadata:
-        print(f"  - metadata:\n{self._safe_json_dumps(metadata)}")
-
-    request_data: Dict[str, Any] = {
-        "spaceId": space_id,
-        "contentType": content_type,
-    }
-    if metadata:
-      request_data["metadata"] = metadata
-
-    if self._debug:
-      print(f"[DEBUG] request_data:\n{self._safe_json_dumps(request_data)}")
-
-    data = {"request": json.dumps(request_data)}
-    files = {"file": ("upload", content_bytes, content_type)}
-
-    if self._debug:
-      print(f"[DEBUG] Making POST request to {url}")
-    response = self._client.post(
-        url,
-        data=data,
-        files=files,
-        timeout=120.0,
+    return self._run(
+        self._insert_memory_binary_flow(
+            space_id, content_bytes, content_type, metadata
+        )
     )
-    if self._debug:
-      print(f"[DEBUG] Response status: {response.status_code}")
-
-    response.raise_for_status()
-    result = response.json()
-    if self._debug:
-      print(f"[DEBUG] Response:\n{self._safe_json_dumps(result)}")
-    return result
 
   def retrieve_memories(
       self,
@@ -243,6 +1273,10 @@ class GoodmemClient:
       space_ids: List of space IDs to search in.
       request_size: The number of chunks to retrieve.
 
+    When the client was built with a ``retrieval_cache_size``, results are
+    served from an in-process LRU cache keyed by the exact query, the set of
+    space IDs and ``request_size`` while a fresh entry exists.
+
     Returns:
       List of matching chunks (parsed from NDJSON response).
 
@@ -250,29 +1284,20 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/memories:retrieve"
-    headers = {**self._headers, "Accept": "application/x-ndjson"}
-    payload = {
-        "message": query,
-        "spaceKeys": [{"spaceId": sid} for sid in space_ids],
-        "requestedSize": request_size,
-    }
-
-    response = self._client.post(
-        url, json=payload, headers=headers, timeout=30.0
+    return self._run(
+        self._retrieve_memories_flow(query, space_ids, request_size)
     )
-    response.raise_for_status()
 
-    chunks: List[Dict[str, Any]] = []
-    for line in response.text.strip().split("\n"):
-      if line.strip():
-        try:
-          tmp_dict = json.loads(line)
-          if "retrievedItem" in tmp_dict:
-            chunks.append(tmp_dict)
-        except json.JSONDecodeError:
-          continue
-    return chunks
+  async def aretrieve_memories(
+      self,
+      query: str,
+      space_ids: List[str],
+      request_size: int = 5,
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`retrieve_memories` (shares its cache)."""
+    return await self.async_client.aretrieve_memories(
+        query, space_ids, request_size=request_size
+    )
 
   def list_spaces(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
     """Lists spaces, optionally filtering by name.
@@ -284,30 +1309,19 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/spaces"
-    all_spaces: List[Dict[str, Any]] = []
-    next_token: Optional[str] = None
-    max_results = 1000
-
-    while True:
-      params: Dict[str, Any] = {"maxResults": max_results}
-      if next_token:
-        params["nextToken"] = next_token
-      if name:
-        params["nameFilter"] = name
+    return self._run(self._list_spaces_flow(name))
 
-      response = self._client.get(url, params=params, timeout=30.0)
-      response.raise_for_status()
-
-      data = response.json()
-      spaces = data.get("spaces", [])
-      all_spaces.extend(spaces)
+  def aiter_spaces(
+      self, name: Optional[str] = None
+  ) -> AsyncIterator[Dict[str, Any]]:
+    """See :meth:`GoodmemAsyncClient.aiter_spaces`."""
+    return self.async_client.aiter_spaces(name)
 
-      next_token = data.get("nextToken")
-      if not next_token:
-        break
-
-    return all_spaces
+  async def alist_spaces(
+      self, name: Optional[str] = None
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`list_spaces`."""
+    return await self.async_client.alist_spaces(name)
 
   def list_embedders(self) -> List[Dict[str, Any]]:
     """Lists all embedders.
@@ -319,10 +1333,11 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/embedders"
-    response = self._client.get(url, timeout=30.0)
-    response.raise_for_status()
-    return response.json().get("embedders", [])
+    return self._run(self._list_embedders_flow())
+
+  async def alist_embedders(self) -> List[Dict[str, Any]]:
+    """Async version of :meth:`list_embedders`."""
+    return await self.async_client.alist_embedders()
 
   def create_embedder(
       self,
@@ -355,30 +1370,39 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    url = "/v1/embedders"
-    payload: Dict[str, Any] = {
-        "displayName": display_name,
-        "providerType": provider_type,
-        "endpointUrl": endpoint_url,
-        "modelIdentifier": model_identifier,
-        "dimensionality": dimensionality,
-        "distributionType": distribution_type,
-        "credentials": {
-            "kind": "CREDENTIAL_KIND_API_KEY",
-            "apiKey": {
-                "inlineSecret": api_key,
-            },
-        },
-    }
-    if embedder_id is not None:
-      payload["embedderId"] = embedder_id
-    response = self._client.post(url, json=payload, timeout=30.0)
-    response.raise_for_status()
-    return response.json()
+    return self._run(
+        self._create_embedder_flow(
+            display_name, provider_type, endpoint_url, model_identifier,
+            dimensionality, api_key, distribution_type, embedder_id,
+        )
+    )
+
+  def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
+    """Gets a single memory through the batchGet endpoint.
+
+    Prefer collecting IDs and calling :meth:`get_memories_batch` once when
+    enriching several chunks; this helper keeps one-off lookups on the same
+    code path.
+
+    Args:
+      memory_id: The ID of the memory to retrieve.
+
+    Returns:
+      The memory object, or ``None`` if the server did not return it.
+
+    Raises:
+      httpx.HTTPStatusError: If the API request fails with an error status.
+      httpx.RequestError: If the request fails.
+    """
+    return self._run(self._get_memory_flow(memory_id))
 
   def get_memory_by_id(self, memory_id: str) -> Dict[str, Any]:
     """Gets a memory by its ID.
 
+    .. deprecated::
+      Looping over this method costs one round trip per memory. Use
+      :meth:`get_memories_batch`, or :meth:`get_memory` for a single ID.
+
     Args:
       memory_id: The ID of the memory to retrieve.
 
@@ -389,50 +1413,63 @@ class GoodmemClient:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    encoded_memory_id = quote(memory_id, safe="")
+    warnings.warn(
+        "get_memory_by_id() is deprecated; use get_memories_batch() or "
+        "get_memory() instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    encoded_memory_id = _quote_id(memory_id)
     url = f"/v1/memories/{encoded_memory_id}"
-    response = self._client.get(url, timeout=30.0)
+    response = self._client.get(url)
     response.raise_for_status()
-    return response.json()
+    return _json_object(response)
 
-  def get_memories_batch(self, memory_ids: List[str]) -> List[Dict[str, Any]]:
+  def get_memories_batch(
+      self, memory_ids: List[str], chunk_size: int = 100
+  ) -> List[Dict[str, Any]]:
     """Gets multiple memories by ID in a single request (batch get).
 
     Uses POST /v1/memories:batchGet to avoid N+1 queries when enriching
-    many chunks with full memory metadata.
+    many chunks with full memory metadata. Lists longer than
+    ``chunk_size`` are split into several batchGet requests that are sent
+    concurrently from a small thread pool.
 
     Args:
       memory_ids: List of memory IDs to fetch.
+      chunk_size: Maximum number of IDs per batchGet request.
 
     Returns:
-      List of memory objects (same shape as get_memory_by_id). Order and
+      List of memory objects (same shape as get_memory). Order and
       presence may not match request; missing or failed IDs are omitted.
 
     Raises:
       httpx.HTTPStatusError: If the API request fails with an error status.
       httpx.RequestError: If the request fails.
     """
-    if not memory_ids:
-      return []
-    url = "/v1/memories:batchGet"
-    payload = {"memoryIds": list(memory_ids)}
-    response = self._client.post(url, json=payload, timeout=30.0)
-    response.raise_for_status()
-    data = response.json()
-    return data.get("memories", [])
+    chunks = _split_ids(memory_ids, chunk_size)
+    if len(chunks) <= 1:
+      return self._get_memories_chunk(chunks[0]) if chunks else []
+    with ThreadPoolExecutor(
+        max_workers=min(_BATCH_MAX_WORKERS, len(chunks))
+    ) as executor:
+      results = list(executor.map(self._get_memories_chunk, chunks))
+    return [memory for memories in results for memory in memories]
+
+  def _get_memories_chunk(self, memory_ids: List[str]) -> List[Dict[str, Any]]:
+    """Sends one ``POST /v1/memories:batchGet`` request."""
+    return self._run(self._memories_chunk_flow(memory_ids))
+
+  async def aget_memories_batch(
+      self, memory_ids: List[str], chunk_size: int = 100
+  ) -> List[Dict[str, Any]]:
+    """Async version of :meth:`get_memories_batch` (chunks via ``gather``)."""
+    return await self.async_client.aget_memories_batch(
+        memory_ids, chunk_size=chunk_size
+    )
 
   # -- embedder helpers ------------------------------------------------------
 
-  # Default Google embedder configuration
-  _GOOGLE_EMBEDDER_DISPLAY_NAME = "gemini-embedding-001"
-  _GOOGLE_EMBEDDER_PROVIDER_TYPE = "OPENAI"
-  _GOOGLE_EMBEDDER_ENDPOINT_URL = (
-      "https://generativelanguage.googleapis.com/v1beta/openai"
-  )
-  _GOOGLE_EMBEDDER_MODEL_ID = "gemini-embedding-001"
-  _GOOGLE_EMBEDDER_DIMENSIONALITY = 1536
-  _GOOGLE_EMBEDDER_DISTRIBUTION_TYPE = "DENSE"
-
   def ensure_embedder(
       self,
       embedder_id: Optional[str] = None,
@@ -440,6 +1477,9 @@ class GoodmemClient:
   ) -> str:
     """Return a valid embedder ID, creating a Google embedder if needed.
 
+    The resolved ID is remembered on the client, so later calls without an
+    explicit ``embedder_id`` skip the ``list_embedders`` request.
+
     Resolution order:
     1. If ``embedder_id`` is provided, it must exist — ``ValueError``
        if not found.
@@ -461,31 +1501,26 @@ class GoodmemClient:
         embedders can be resolved and neither ``GOOGLE_API_KEY`` nor
         ``GEMINI_API_KEY`` is set.
     """
-    embedders = self.list_embedders()
-
-    if embedder_id is not None:
-      valid_ids = [e.get("embedderId") for e in embedders]
-      if embedder_id in valid_ids:
-        return embedder_id
-      raise ValueError(
-          f"GOODMEM_EMBEDDER_ID '{embedder_id}' not found. "
-          f"Available embedders: {valid_ids}"
-      )
+    if embedder_id is None and self._embedder_id_cache is not None:
+      return self._embedder_id_cache
 
-    if embedders:
-      eid = embedders[0].get("embedderId")
-      if eid:
-        if debug:
-          print(f"[DEBUG] Using existing embedder: {eid}")
-        return eid
-
-    # No embedders at all — auto-create with server-generated ID
-    if debug:
-      print(
-          "[DEBUG] No embedders found. Auto-creating Google Gemini embedder "
-          f"({self._GOOGLE_EMBEDDER_MODEL_ID}) using GOOGLE_API_KEY"
-      )
-    return self._auto_create_google_embedder(debug=debug)
+    embedders = self.list_embedders()
+    eid = _select_embedder_id(embedders, embedder_id, debug)
+    if eid is None:
+      # No embedders at all — auto-create with server-generated ID
+      eid = self._auto_create_google_embedder(debug=debug)
+    self._embedder_id_cache = eid
+    return eid
+
+  async def aensure_embedder(
+      self,
+      embedder_id: Optional[str] = None,
+      debug: bool = False,
+  ) -> str:
+    """Async version of :meth:`ensure_embedder` (shares its cache)."""
+    return await self.async_client.aensure_embedder(
+        embedder_id=embedder_id, debug=debug
+    )
 
   def _auto_create_google_embedder(
       self,
@@ -503,34 +1538,5 @@ class GoodmemClient:
       ValueError: If neither ``GOOGLE_API_KEY`` nor ``GEMINI_API_KEY`` is
         set.
     """
-    google_api_key = (
-        os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-    )
-    if not google_api_key:
-      raise ValueError(
-          "No embedders available in Goodmem and neither GOOGLE_API_KEY "
-          "nor GEMINI_API_KEY is set. Please create an embedder manually "
-          "or set one of these environment variables to auto-create a "
-          "Google Gemini embedder."
-      )
-
-    response = self.create_embedder(
-        display_name=self._GOOGLE_EMBEDDER_DISPLAY_NAME,
-        provider_type=self._GOOGLE_EMBEDDER_PROVIDER_TYPE,
-        endpoint_url=self._GOOGLE_EMBEDDER_ENDPOINT_URL,
-        model_identifier=self._GOOGLE_EMBEDDER_MODEL_ID,
-        dimensionality=self._GOOGLE_EMBEDDER_DIMENSIONALITY,
-        api_key=google_api_key,
-        distribution_type=self._GOOGLE_EMBEDDER_DISTRIBUTION_TYPE,
-    )
-
-    new_id = response.get("embedderId")
-    if not new_id:
-      raise ValueError(
-          "Failed to auto-create Google embedder: no embedderId in response"
-      )
-
-    if debug:
-      print(f"[DEBUG] Auto-created Google embedder: {new_id}")
-
-    return new_id
+    response = self.create_embedder(**_google_embedder_kwargs(debug))
+    return _created_embedder_id(response, debug)
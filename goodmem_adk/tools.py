@@ -970,15 +970,17 @@ async def goodmem_fetch(
           f"{len(chunk_data_list)} chunks, {len(memory_ids)} unique memory IDs"
       )
 
-    # Fetch full memory metadata for each unique memory ID
+    # Fetch full memory metadata for all unique memory IDs in one request
     memory_metadata_cache: Dict[str, Dict[str, JsonValue]] = {}
-    for memory_id in memory_ids:
-      try:
-        full_memory = client.get_memory_by_id(memory_id)
-        if full_memory:
-          memory_metadata_cache[memory_id] = full_memory.get("metadata", {})
-      except Exception:
-        memory_metadata_cache[memory_id] = {}
+    try:
+      batch = client.get_memories_batch(list(memory_ids))
+      for full_memory in batch:
+        mid = full_memory.get("memoryId")
+        if mid is not None:
+          memory_metadata_cache[mid] = full_memory.get("metadata", {})
+    except Exception as e:
+      if debug:
+        print(f"[DEBUG] Failed to batch-fetch metadata for memories: {e}")
 
     # Build response with memories
     memories: List[MemoryItem] = []
@@ -19,14 +19,16 @@ from __future__ import annotations
 import pytest
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_receipt_pdf() -> bytes:
     """Generate a mock receipt PDF (Acme Corp -> GoodMind Inc.) and return raw bytes.
 
     The receipt contains specific addresses, line items, and a total that
-    integration tests can verify via semantic retrieval.
-    
-    The PDF is also saved to mock_receipt.pdf in the repo root for visual inspection.
+    integration tests can verify via semantic retrieval. Built once per
+    session; the bytes are immutable, so tests can share them.
+
+    Set ``PYTEST_WRITE_RECEIPT_PDF=1`` to also save it to mock_receipt.pdf in
+    the repo root for visual inspection.
     """
     from fpdf import FPDF
     from fpdf.enums import XPos, YPos
@@ -91,11 +93,12 @@ def mock_receipt_pdf() -> bytes:
     pdf.cell(col_amt_w, 8, "$4,225.50", border="T", align="R", **NL)
 
     pdf_bytes = bytes(pdf.output())
-    
+
     # Save to disk for visual inspection
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    output_path = os.path.join(repo_root, "mock_receipt.pdf")
-    with open(output_path, "wb") as f:
-        f.write(pdf_bytes)
-    
+    if os.environ.get("PYTEST_WRITE_RECEIPT_PDF") == "1":
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output_path = os.path.join(repo_root, "mock_receipt.pdf")
+        with open(output_path, "wb") as f:
+            f.write(pdf_bytes)
+
     return pdf_bytes
@@ -14,12 +14,27 @@
 
 """Unit tests for GoodmemClient."""
 
+import asyncio
+import io
 import json
-from unittest.mock import MagicMock, patch
-
+from contextlib import nullcontext
+from email.message import Message
+from email.parser import BytesParser
+from types import SimpleNamespace
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 import pytest
 
-from goodmem_adk.client import GoodmemClient
+from goodmem_adk.client import GoodmemAsyncClient, GoodmemClient, fanout_retrieve
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional extra
+    _loads = json.loads
 
 # Mock constants
 MOCK_BASE_URL = "https://api.goodmem.ai"
@@ -28,323 +43,1053 @@ MOCK_SPACE_ID = "test-space-id"
 MOCK_EMBEDDER_ID = "test-embedder-id"
 MOCK_MEMORY_ID = "test-memory-id"
 
+# Captured before any test swaps httpx.Client for a mock.
+_REAL_HTTPX_CLIENT = httpx.Client
+
+# NDJSON retrieval bodies, built once at import.
+NDJSON_ONE_ITEM = '{"retrievedItem": {"chunk": {"chunk": {"chunkText": "t"}}}}'
+NDJSON_TWO_ITEMS = "\n".join([
+    '{"retrievedItem": {"chunk": {"chunk": {"chunkText": "text1"}}}}',
+    '{"status": "complete"}',
+    '{"retrievedItem": {"chunk": {"chunk": {"chunkText": "text2"}}}}',
+])
+NDJSON_BLANK_LINES = (
+    '\n{"retrievedItem": {"chunk": {"chunk": {"memoryId": "1", "chunkText": "First"}}}}'
+    '\n\n{"retrievedItem": {"chunk": {"chunk": {"memoryId": "2", "chunkText": "Second"}}}}\n'
+)
+
+
+class _RecordingClient:
+    """Hand-rolled stand-in for an ``httpx.Client`` instance.
+
+    Every call is appended to :attr:`calls` as a ``(method, args, kwargs)``
+    tuple. A verb answers with whatever the handler registered through
+    :meth:`on` or :meth:`returns` produces, or ``None`` if none was set.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+
+    def on(self, method: str, handler: Callable[..., Any]) -> None:
+        """Answers ``method`` calls with ``handler(*args, **kwargs)``."""
+        self._handlers[method] = handler
+
+    def returns(self, method: str, value: Any) -> None:
+        """Answers every ``method`` call with ``value``."""
+        self.on(method, lambda *args, **kwargs: value)
+
+    def calls_to(self, method: str) -> List[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+        """The ``(args, kwargs)`` of each ``method`` call, in order."""
+        return [(args, kwargs) for name, args, kwargs in self.calls if name == method]
+
+    def _call(self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        self.calls.append((method, args, kwargs))
+        handler = self._handlers.get(method)
+        return handler(*args, **kwargs) if handler is not None else None
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("get", args, kwargs)
+
+    def post(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("post", args, kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("delete", args, kwargs)
+
+    def head(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("head", args, kwargs)
+
+    def stream(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("stream", args, kwargs)
+
+    def close(self) -> None:
+        self._call("close", (), {})
+
+
+@pytest.fixture
+def mock_httpx_client(monkeypatch: pytest.MonkeyPatch) -> _RecordingClient:
+    """Replaces ``GoodmemClient``'s ``httpx.Client`` with a :class:`_RecordingClient`."""
+    recorder = _RecordingClient()
+    monkeypatch.setattr(
+        "goodmem_adk.client.httpx.Client", lambda *args, **kwargs: recorder
+    )
+    return recorder
+
+
+class _MockServer:
+    """Answers requests sent through a real ``httpx.Client`` in-process.
+
+    Every request is recorded in :attr:`requests`. Responses are taken from
+    the queue set by :meth:`respond`; once it is down to its last entry that
+    response is reused, and by default every request gets a memory ID back.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.transport = httpx.MockTransport(self._handle)
+        self.respond(json={"memoryId": MOCK_MEMORY_ID})
+
+    def respond(
+        self, *responses: httpx.Response, status_code: int = 200, **kwargs: Any
+    ) -> None:
+        """Queues ``responses``, or a single ``httpx.Response(status_code, **kwargs)``."""
+        self._responses = list(responses) or [httpx.Response(status_code, **kwargs)]
+
+    @property
+    def last_request(self) -> httpx.Request:
+        return self.requests[-1]
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self._responses[0]
+        if len(self._responses) > 1:
+            self._responses.pop(0)
+        # Fresh copy so a reused response can be streamed more than once.
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+@pytest.fixture
+def mock_server(monkeypatch: pytest.MonkeyPatch) -> _MockServer:
+    """Routes ``GoodmemClient``'s sync ``httpx.Client`` to a :class:`_MockServer`."""
+    server = _MockServer()
+
+    def client_with_mock_transport(*args: Any, **kwargs: Any) -> httpx.Client:
+        kwargs["transport"] = server.transport
+        return _REAL_HTTPX_CLIENT(*args, **kwargs)
+
+    monkeypatch.setattr("goodmem_adk.client.httpx.Client", client_with_mock_transport)
+    return server
+
+
+@pytest.fixture
+def client(mock_server: _MockServer) -> GoodmemClient:
+    """A fresh client talking to :func:`mock_server`.
+
+    Function-scoped on purpose: the client's retrieval and embedder caches
+    must not carry over between tests. Classes that need a different
+    backend override this fixture.
+    """
+    return GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+
+
+def _json_bytes(data: object) -> bytes:
+    """Encodes ``data`` as a mock ``httpx.Response.content`` body."""
+    return json.dumps(data).encode()
+
+
+def _resp(*, json: object = None, status_code: int = 200) -> SimpleNamespace:
+    """Builds a plain stand-in for a successful ``httpx.Response``.
+
+    Much cheaper than a ``MagicMock`` and exposes only what the client reads.
+    """
+    return SimpleNamespace(
+        content=_json_bytes(json),
+        status_code=status_code,
+        raise_for_status=lambda: None,
+    )
+
+
+# Two pages of list_spaces results linked by nextToken, built once. Callers
+# copy the list before handing it to a mock's side_effect.
+_SPACES_PAGES = (
+    {"spaces": [{"spaceId": "s1"}], "nextToken": "token123"},
+    {"spaces": [{"spaceId": "s2"}]},
+)
+_PAGED_SPACES_RESPONSES = [_resp(json=page) for page in _SPACES_PAGES]
+_PAGED_SPACES_HTTPX_RESPONSES = [
+    httpx.Response(200, json=page) for page in _SPACES_PAGES
+]
+
+
+def _stream_response(text: str) -> ContextManager[SimpleNamespace]:
+    """Builds a stand-in ``httpx.Client.stream(...)`` context yielding ``text``."""
+    return nullcontext(SimpleNamespace(
+        is_error=False,
+        raise_for_status=lambda: None,
+        iter_lines=lambda: iter(text.splitlines()),
+    ))
+
+
+def _astream_response(text: str) -> MagicMock:
+    """Async counterpart of :func:`_stream_response`."""
+
+    async def aiter_lines():
+        for line in text.splitlines():
+            yield line
+
+    response = MagicMock()
+    response.is_error = False
+    response.aiter_lines = aiter_lines
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__.return_value = response
+    return stream_ctx
+
 
 class TestGoodmemClientInit:
     """Tests for GoodmemClient initialization."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _patch_httpx_client(cls) -> MagicMock:
+        """Installs one ``httpx.Client`` patch for the whole class."""
+        with patch("goodmem_adk.client.httpx.Client") as mock_class:
+            yield mock_class
+
+    @pytest.fixture
+    def mock_client_class(self, _patch_httpx_client: MagicMock) -> MagicMock:
+        """The patched ``httpx.Client`` class, with no recorded calls."""
+        _patch_httpx_client.reset_mock(return_value=True, side_effect=True)
+        return _patch_httpx_client
+
     def test_init_sets_base_url(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client"):
-            client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
-            assert client._base_url == MOCK_BASE_URL
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        assert client._base_url == MOCK_BASE_URL
 
     def test_init_strips_trailing_slash(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client"):
-            client = GoodmemClient(f"{MOCK_BASE_URL}/", MOCK_API_KEY)
-            assert client._base_url == MOCK_BASE_URL
+        client = GoodmemClient(f"{MOCK_BASE_URL}/", MOCK_API_KEY)
+        assert client._base_url == MOCK_BASE_URL
 
     def test_init_sets_api_key(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client"):
-            client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
-            assert client._api_key == MOCK_API_KEY
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        assert client._api_key == MOCK_API_KEY
 
     def test_init_sets_default_headers(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client"):
-            client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
-            assert client._headers["x-api-key"] == MOCK_API_KEY
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        assert client._headers["x-api-key"] == MOCK_API_KEY
+
+    def test_init_creates_httpx_client(self, mock_client_class: MagicMock) -> None:
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        mock_client_class.assert_called_once()
+        call_kwargs = mock_client_class.call_args.kwargs
+        assert call_kwargs["base_url"] == MOCK_BASE_URL
+        assert call_kwargs["headers"]["x-api-key"] == MOCK_API_KEY
+        assert call_kwargs["timeout"] == httpx.Timeout(
+            30.0, connect=5.0, pool=5.0
+        )
 
-    def test_init_creates_httpx_client(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
-            GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
-            mock_client_class.assert_called_once()
-            call_kwargs = mock_client_class.call_args.kwargs
-            assert call_kwargs["base_url"] == MOCK_BASE_URL
-            assert call_kwargs["headers"]["x-api-key"] == MOCK_API_KEY
+    def test_init_uses_pooled_http2_transport(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        transport = mock_client_class.call_args.kwargs["transport"]
+        assert isinstance(transport, httpx.HTTPTransport)
 
-    def test_context_manager(self) -> None:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            with GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY) as client:
-                pass
-            mock_client.close.assert_called_once()
+    def test_init_makes_no_requests_by_default(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        mock_client_class.return_value.head.assert_not_called()
 
+    def test_init_warmup_sends_head(self, mock_client_class: MagicMock) -> None:
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY, warmup=True)
+        mock_client_class.return_value.head.assert_called_once_with(
+            "/v1/embedders"
+        )
 
-class TestGoodmemClientTextMemory:
-    """Tests for text memory operations."""
+    def test_warm_up_swallows_connection_errors(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        mock_client_class.return_value.head.side_effect = (
+            httpx.ConnectError("refused")
+        )
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        client.warm_up()
 
-    @pytest.fixture
-    def mock_httpx_client(self) -> MagicMock:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            yield mock_client
+        mock_client_class.return_value.head.assert_called_once_with(
+            "/v1/embedders"
+        )
+
+    def test_context_manager(self, mock_client_class: MagicMock) -> None:
+        with GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY):
+            pass
+        mock_client_class.return_value.close.assert_called_once()
 
-    @pytest.fixture
-    def client(self, mock_httpx_client: MagicMock) -> GoodmemClient:
-        return GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
 
+class TestGoodmemClientTextMemory:
+    """Tests for text memory operations."""
+
+    @pytest.mark.parametrize(
+        "metadata, expected_body",
+        [
+            pytest.param(
+                {"key": "value"},
+                {
+                    "spaceId": MOCK_SPACE_ID,
+                    "originalContent": "test content",
+                    "contentType": "text/plain",
+                    "metadata": {"key": "value"},
+                },
+                id="with_metadata",
+            ),
+            pytest.param(
+                None,
+                {
+                    "spaceId": MOCK_SPACE_ID,
+                    "originalContent": "test content",
+                    "contentType": "text/plain",
+                },
+                id="without_metadata",
+            ),
+        ],
+    )
     def test_insert_memory_sends_json(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+        self,
+        client: GoodmemClient,
+        mock_server: _MockServer,
+        metadata: Optional[Dict[str, str]],
+        expected_body: Dict[str, object],
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"memoryId": MOCK_MEMORY_ID}
-        mock_httpx_client.post.return_value = mock_response
-
         result = client.insert_memory(
-            MOCK_SPACE_ID, "test content", "text/plain", {"key": "value"}
+            MOCK_SPACE_ID, "test content", "text/plain", metadata
         )
 
         assert result["memoryId"] == MOCK_MEMORY_ID
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        assert call_kwargs["json"]["spaceId"] == MOCK_SPACE_ID
-        assert call_kwargs["json"]["originalContent"] == "test content"
-        assert call_kwargs["json"]["contentType"] == "text/plain"
-        assert call_kwargs["json"]["metadata"] == {"key": "value"}
-
-    def test_insert_memory_without_metadata(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+        request = mock_server.last_request
+        assert request.method == "POST"
+        assert request.url.path == "/v1/memories"
+        assert request.headers["Content-Type"] == "application/json"
+        assert _loads(request.content) == expected_body
+
+    def test_insert_memory_without_orjson(
+        self, client: GoodmemClient, mock_server: _MockServer
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"memoryId": MOCK_MEMORY_ID}
-        mock_httpx_client.post.return_value = mock_response
+        with patch("goodmem_adk.client.orjson", None):
+            result = client.insert_memory(MOCK_SPACE_ID, "test content")
+
+        assert result["memoryId"] == MOCK_MEMORY_ID
+        assert _loads(mock_server.last_request.content)["spaceId"] == MOCK_SPACE_ID
+
+
+BINARY_CONTENT = b"test binary content"
+BINARY_METADATA = {"filename": "test.pdf", "user_id": "user123"}
+
 
-        client.insert_memory(MOCK_SPACE_ID, "test content", "text/plain")
+def _multipart_parts(request: httpx.Request) -> Dict[str, Message]:
+    """Parses a ``multipart/form-data`` request body into parts by field name."""
+    message = BytesParser().parsebytes(
+        f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+        + request.content
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.get_payload()
+    }
 
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        assert "metadata" not in call_kwargs["json"]
+
+def _check_no_json_content_type(request: httpx.Request) -> None:
+    # httpx must set the multipart boundary header itself.
+    assert request.headers["Content-Type"].startswith(
+        "multipart/form-data; boundary="
+    )
+
+
+def _check_multipart_structure(request: httpx.Request) -> None:
+    parts = _multipart_parts(request)
+    request_json = _loads(parts["request"].get_payload(decode=True))
+    assert request_json["spaceId"] == MOCK_SPACE_ID
+    assert request_json["contentType"] == "application/pdf"
+    assert request_json["metadata"] == BINARY_METADATA
+
+    upload = parts["file"]
+    assert upload.get_filename() == "upload"
+    assert upload.get_payload(decode=True) == BINARY_CONTENT
+    assert upload.get_content_type() == "application/pdf"
+
+
+def _check_upload_timeout(request: httpx.Request) -> None:
+    assert request.extensions["timeout"]["read"] == 120.0
 
 
 class TestGoodmemClientBinaryMemory:
     """Tests for binary memory operations."""
 
-    @pytest.fixture
-    def mock_httpx_client(self) -> MagicMock:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-            yield mock_client
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(_check_no_json_content_type, id="no_content_type_header"),
+            pytest.param(_check_multipart_structure, id="multipart_structure"),
+            pytest.param(_check_upload_timeout, id="timeout"),
+        ],
+    )
+    def test_insert_memory_binary_request(
+        self,
+        client: GoodmemClient,
+        mock_server: _MockServer,
+        check: Callable[[httpx.Request], None],
+    ) -> None:
+        client.insert_memory_binary(
+            MOCK_SPACE_ID, BINARY_CONTENT, "application/pdf", BINARY_METADATA,
+        )
+
+        check(mock_server.last_request)
+
+    def test_insert_memory_binary_accepts_file_object(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        # Inspects the call itself: the file object must be handed to httpx
+        # as-is rather than read into memory first.
+        mock_httpx_client.returns("post", _resp(json={"memoryId": MOCK_MEMORY_ID}))
+        file_obj = io.BytesIO(b"streamed content")
+
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY).insert_memory_binary(
+            MOCK_SPACE_ID, file_obj, "application/pdf"
+        )
+
+        _, kwargs = mock_httpx_client.calls_to("post")[-1]
+        files = kwargs["files"]
+        assert files["file"][1] is file_obj
+
+    def test_insert_memory_binary_debug_output(
+        self, mock_server: _MockServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY).insert_memory_binary(
+            MOCK_SPACE_ID, b"abc", "application/pdf", {"filename": "a.pdf"}
+        )
+        assert capsys.readouterr().out == ""
+
+        GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY, debug=True).insert_memory_binary(
+            MOCK_SPACE_ID, b"abc", "application/pdf", {"filename": "a.pdf"}
+        )
+        out = capsys.readouterr().out
+        assert "content_bytes length: 3 bytes" in out
+        assert '"filename": "a.pdf"' in out
+        assert "Response status: 200" in out
+
+    def test_safe_json_dumps_falls_back_to_repr(
+        self, client: GoodmemClient
+    ) -> None:
+        class Opaque:
+            def __repr__(self) -> str:
+                return "<opaque>"
+
+        dumped = client._safe_json_dumps({"value": Opaque()})
+
+        assert _loads(dumped) == {"value": "<opaque>"}
+        with patch("goodmem_adk.client.orjson", None):
+            assert _loads(client._safe_json_dumps({"value": Opaque()})) == {
+                "value": "<opaque>"
+            }
+
+
+class TestGoodmemClientSpaces:
+    """Tests for space operations."""
+
+    def test_create_space(
+        self, client: GoodmemClient, mock_server: _MockServer
+    ) -> None:
+        mock_server.respond(json={"spaceId": MOCK_SPACE_ID})
+
+        result = client.create_space("test-space", MOCK_EMBEDDER_ID)
+
+        assert result["spaceId"] == MOCK_SPACE_ID
+        request = mock_server.last_request
+        assert request.url.path == "/v1/spaces"
+        body = _loads(request.content)
+        assert body["name"] == "test-space"
+        assert body["spaceEmbedders"][0]["embedderId"] == MOCK_EMBEDDER_ID
+        assert body["defaultChunkingConfig"]["recursive"]["chunkSize"] == 512
+
+    @pytest.mark.parametrize(
+        "name, spaces",
+        [
+            pytest.param(
+                None, [{"spaceId": "s1"}, {"spaceId": "s2"}], id="no_filter"
+            ),
+            pytest.param(
+                "test-space",
+                [{"spaceId": "s1", "name": "test-space"}],
+                id="with_name_filter",
+            ),
+        ],
+    )
+    def test_list_spaces(
+        self,
+        client: GoodmemClient,
+        mock_server: _MockServer,
+        name: Optional[str],
+        spaces: List[Dict[str, str]],
+    ) -> None:
+        mock_server.respond(json={"spaces": spaces})
+
+        result = client.list_spaces(name=name)
+
+        assert result == spaces
+        assert mock_server.last_request.url.params.get("nameFilter") == name
+
+    def test_list_spaces_pagination(
+        self, client: GoodmemClient, mock_server: _MockServer
+    ) -> None:
+        mock_server.respond(*_PAGED_SPACES_HTTPX_RESPONSES)
+
+        result = client.list_spaces()
+
+        assert len(result) == 2
+        assert len(mock_server.requests) == 2
+        assert mock_server.requests[1].url.params["nextToken"] == "token123"
+
+    def test_delete_space(
+        self, client: GoodmemClient, mock_server: _MockServer
+    ) -> None:
+        mock_server.respond(status_code=200)
+
+        client.delete_space(MOCK_SPACE_ID)
+
+        assert len(mock_server.requests) == 1
+        request = mock_server.last_request
+        assert request.method == "DELETE"
+        assert MOCK_SPACE_ID in request.url.path
+
+    @pytest.mark.parametrize(
+        "space_id, expected_path",
+        [
+            (
+                "3f2b1c9e-8d4a-4e6f-9a1b-2c3d4e5f6a7b",
+                "/v1/spaces/3f2b1c9e-8d4a-4e6f-9a1b-2c3d4e5f6a7b",
+            ),
+            ("team/space one", "/v1/spaces/team%2Fspace%20one"),
+        ],
+    )
+    def test_get_space_encodes_id(
+        self,
+        client: GoodmemClient,
+        mock_server: _MockServer,
+        space_id: str,
+        expected_path: str,
+    ) -> None:
+        mock_server.respond(status_code=404)
+
+        assert client.get_space(space_id) is None
+        assert mock_server.last_request.url.raw_path == expected_path.encode()
+
+
+class TestGoodmemClientRetrieve:
+    """Tests for memory retrieval."""
+
+    @pytest.mark.parametrize(
+        "ndjson, expected_count",
+        [
+            pytest.param(NDJSON_TWO_ITEMS, 2, id="skips_status_lines"),
+            pytest.param("", 0, id="empty_response"),
+            pytest.param(NDJSON_BLANK_LINES, 2, id="blank_lines"),
+        ],
+    )
+    def test_retrieve_memories_parses_ndjson(
+        self,
+        client: GoodmemClient,
+        mock_server: _MockServer,
+        ndjson: str,
+        expected_count: int,
+    ) -> None:
+        mock_server.respond(text=ndjson)
+
+        result = client.retrieve_memories("query", [MOCK_SPACE_ID])
+
+        assert len(result) == expected_count
+
+    def test_retrieve_memories_sends_correct_payload(
+        self, client: GoodmemClient, mock_server: _MockServer
+    ) -> None:
+        mock_server.respond(text="")
+
+        client.retrieve_memories("test query", ["space1", "space2"], request_size=10)
+
+        request = mock_server.last_request
+        assert request.method == "POST"
+        assert request.url.path == "/v1/memories:retrieve"
+        body = _loads(request.content)
+        assert body["message"] == "test query"
+        assert body["requestedSize"] == 10
+        assert body["spaceKeys"] == [
+            {"spaceId": "space1"},
+            {"spaceId": "space2"},
+        ]
+
+    def test_error_status_reads_body_before_raising(
+        self, client: GoodmemClient, mock_server: _MockServer
+    ) -> None:
+        mock_server.respond(status_code=500, text="boom")
+
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            client.retrieve_memories("test", ["space-1"])
+        # Accessing .text on an unread streamed response would raise.
+        assert excinfo.value.response.text == "boom"
+
+
+class TestGoodmemClientMemoryLookup:
+    """Tests for fetching memories by ID."""
 
     @pytest.fixture
-    def client(self, mock_httpx_client: MagicMock) -> GoodmemClient:
+    def client(self, mock_httpx_client: _RecordingClient) -> GoodmemClient:
         return GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
 
-    def test_insert_memory_binary_no_content_type_header(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_get_memory_uses_batch_endpoint(
+        self, client: GoodmemClient, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"memoryId": MOCK_MEMORY_ID}
-        mock_httpx_client.post.return_value = mock_response
+        mock_httpx_client.returns("post", _resp(json=
+            {"memories": [{"memoryId": MOCK_MEMORY_ID, "metadata": {}}]}
+        ))
 
-        client.insert_memory_binary(
-            MOCK_SPACE_ID, b"test binary content", "application/pdf",
-        )
+        result = client.get_memory(MOCK_MEMORY_ID)
 
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        headers = call_kwargs.get("headers", {})
-        assert "Content-Type" not in headers
-        assert "content-type" not in headers
+        assert result is not None
+        assert result["memoryId"] == MOCK_MEMORY_ID
+        args, kwargs = mock_httpx_client.calls_to("post")[-1]
+        assert args[0] == "/v1/memories:batchGet"
+        assert _loads(kwargs["content"]) == {
+            "memoryIds": [MOCK_MEMORY_ID]
+        }
 
-    def test_insert_memory_binary_multipart_structure(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_get_memory_missing_returns_none(
+        self, client: GoodmemClient, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"memoryId": MOCK_MEMORY_ID}
-        mock_httpx_client.post.return_value = mock_response
+        mock_httpx_client.returns("post", _resp(json={"memories": []}))
 
-        file_bytes = b"test binary content"
-        metadata = {"filename": "test.pdf", "user_id": "user123"}
+        assert client.get_memory(MOCK_MEMORY_ID) is None
 
-        client.insert_memory_binary(
-            MOCK_SPACE_ID, file_bytes, "application/pdf", metadata,
-        )
+    def test_get_memories_batch_splits_long_lists(
+        self, client: GoodmemClient, mock_httpx_client: _RecordingClient
+    ) -> None:
+        def respond(url, content, headers):
+            ids = _loads(content)["memoryIds"]
+            return _resp(json={"memories": [{"memoryId": mid} for mid in ids]})
 
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
+        mock_httpx_client.on("post", respond)
+        memory_ids = [f"m{i}" for i in range(5)]
 
-        assert "data" in call_kwargs
-        request_json = json.loads(call_kwargs["data"]["request"])
-        assert request_json["spaceId"] == MOCK_SPACE_ID
-        assert request_json["contentType"] == "application/pdf"
-        assert request_json["metadata"] == metadata
+        result = client.get_memories_batch(memory_ids, chunk_size=2)
 
-        assert "files" in call_kwargs
-        files = call_kwargs["files"]
-        assert "file" in files
-        assert files["file"][0] == "upload"
-        assert files["file"][1] == file_bytes
-        assert files["file"][2] == "application/pdf"
+        assert len(mock_httpx_client.calls_to("post")) == 3
+        assert [m["memoryId"] for m in result] == memory_ids
 
-    def test_insert_memory_binary_timeout(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_get_memory_by_id_is_deprecated(
+        self, client: GoodmemClient, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"memoryId": MOCK_MEMORY_ID}
-        mock_httpx_client.post.return_value = mock_response
+        mock_httpx_client.returns("get", _resp(json={"memoryId": MOCK_MEMORY_ID}))
 
-        client.insert_memory_binary(
-            MOCK_SPACE_ID, b"test binary content", "application/pdf",
-        )
+        with pytest.warns(DeprecationWarning, match="get_memories_batch"):
+            result = client.get_memory_by_id(MOCK_MEMORY_ID)
 
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        assert call_kwargs["timeout"] == 120.0
+        assert result["memoryId"] == MOCK_MEMORY_ID
 
 
-class TestGoodmemClientSpaces:
-    """Tests for space operations."""
+class TestGoodmemClientAsync:
+    """Tests for the async client methods."""
 
     @pytest.fixture
-    def mock_httpx_client(self) -> MagicMock:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
+    def mock_async_client(self) -> MagicMock:
+        with patch("goodmem_adk.client.httpx.Client"), patch(
+            "goodmem_adk.client.httpx.AsyncClient"
+        ) as mock_client_class:
             mock_client = MagicMock()
+            mock_client.get = AsyncMock()
+            mock_client.post = AsyncMock()
+            mock_client.aclose = AsyncMock()
             mock_client_class.return_value = mock_client
             yield mock_client
 
     @pytest.fixture
-    def client(self, mock_httpx_client: MagicMock) -> GoodmemClient:
+    def client(self, mock_async_client: MagicMock) -> GoodmemClient:
         return GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
 
-    def test_create_space(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    @pytest.mark.asyncio
+    async def test_aretrieve_memories_parses_ndjson(
+        self, client: GoodmemClient, mock_async_client: MagicMock
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"spaceId": MOCK_SPACE_ID}
-        mock_httpx_client.post.return_value = mock_response
+        mock_async_client.stream.return_value = _astream_response(NDJSON_TWO_ITEMS)
 
-        result = client.create_space("test-space", MOCK_EMBEDDER_ID)
+        result = await client.aretrieve_memories("query", [MOCK_SPACE_ID])
 
-        assert result["spaceId"] == MOCK_SPACE_ID
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        assert call_kwargs["json"]["name"] == "test-space"
-        assert call_kwargs["json"]["spaceEmbedders"][0]["embedderId"] == MOCK_EMBEDDER_ID
+        assert len(result) == 2
+        call_kwargs = mock_async_client.stream.call_args.kwargs
+        body = _loads(call_kwargs["content"])
+        assert body["spaceKeys"] == [{"spaceId": MOCK_SPACE_ID}]
 
-    def test_list_spaces_no_filter(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    @pytest.mark.asyncio
+    async def test_alist_spaces_follows_next_token(
+        self, client: GoodmemClient, mock_async_client: MagicMock
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "spaces": [{"spaceId": "s1"}, {"spaceId": "s2"}]
-        }
-        mock_httpx_client.get.return_value = mock_response
+        mock_async_client.get.side_effect = list(_PAGED_SPACES_RESPONSES)
 
-        result = client.list_spaces()
+        result = await client.alist_spaces(name="test-space")
 
-        assert len(result) == 2
-        call_kwargs = mock_httpx_client.get.call_args.kwargs
-        assert "nameFilter" not in call_kwargs["params"]
+        assert [s["spaceId"] for s in result] == ["s1", "s2"]
+        second_params = mock_async_client.get.call_args_list[1].kwargs["params"]
+        assert second_params["nextToken"] == "token123"
+        assert second_params["nameFilter"] == "test-space"
 
-    def test_list_spaces_with_name_filter(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    @pytest.mark.asyncio
+    async def test_aiter_spaces_prefetches_next_page(
+        self, client: GoodmemClient, mock_async_client: MagicMock
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "spaces": [{"spaceId": "s1", "name": "test-space"}]
-        }
-        mock_httpx_client.get.return_value = mock_response
+        mock_async_client.get.side_effect = list(_PAGED_SPACES_RESPONSES)
 
-        result = client.list_spaces(name="test-space")
+        spaces = client.aiter_spaces()
+        first = await spaces.__anext__()
+        # Let the prefetch task start before the caller asks for page two.
+        await asyncio.sleep(0)
 
-        assert len(result) == 1
-        call_kwargs = mock_httpx_client.get.call_args.kwargs
-        assert call_kwargs["params"]["nameFilter"] == "test-space"
+        assert first["spaceId"] == "s1"
+        assert mock_async_client.get.call_count == 2
+        await spaces.aclose()
 
-    def test_list_spaces_pagination(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    @pytest.mark.asyncio
+    async def test_aiter_spaces_close_waits_for_cancelled_prefetch(
+        self, client: GoodmemClient, mock_async_client: MagicMock
     ) -> None:
-        mock_response1 = MagicMock()
-        mock_response1.json.return_value = {
-            "spaces": [{"spaceId": "s1"}],
-            "nextToken": "token123",
-        }
-        mock_response2 = MagicMock()
-        mock_response2.json.return_value = {
-            "spaces": [{"spaceId": "s2"}],
-        }
-        mock_httpx_client.get.side_effect = [mock_response1, mock_response2]
+        cancelled = asyncio.Event()
 
-        result = client.list_spaces()
+        async def get(url, params):
+            if "nextToken" not in params:
+                return _PAGED_SPACES_RESPONSES[0]
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_async_client.get.side_effect = get
+
+        spaces = client.aiter_spaces()
+        await spaces.__anext__()
+        await asyncio.sleep(0)
+        await spaces.aclose()
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_aget_memories_batch_empty_skips_request(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        assert await client.aget_memories_batch([]) == []
+        mock_async_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aget_memories_batch_splits_long_lists(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.post.return_value = _resp(json={"memories": [{"memoryId": "m"}]})
+
+        result = await client.aget_memories_batch(
+            [f"m{i}" for i in range(250)]
+        )
+
+        assert mock_async_client.post.call_count == 3
+        assert len(result) == 3
+        sizes = [
+            len(_loads(c.kwargs["content"])["memoryIds"])
+            for c in mock_async_client.post.call_args_list
+        ]
+        assert sizes == [100, 100, 50]
+
+    @pytest.mark.asyncio
+    async def test_aensure_embedder_uses_first_available(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.get.return_value = _resp(json={
+            "embedders": [{"embedderId": MOCK_EMBEDDER_ID}]
+        })
+
+        assert await client.aensure_embedder() == MOCK_EMBEDDER_ID
+
+    @pytest.mark.asyncio
+    async def test_fanout_retrieve_one_request_per_space(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.stream.side_effect = lambda *a, **kw: _astream_response(NDJSON_ONE_ITEM)
+
+        result = await fanout_retrieve(client, "query", ["space1", "space2"])
 
         assert len(result) == 2
-        assert mock_httpx_client.get.call_count == 2
+        assert mock_async_client.stream.call_count == 2
 
-    def test_delete_space(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    @pytest.mark.asyncio
+    async def test_async_context_manager(
+        self, mock_async_client: MagicMock
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_httpx_client.delete.return_value = mock_response
+        async with GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY) as client:
+            assert client.async_client._aclient is mock_async_client
+        mock_async_client.aclose.assert_awaited_once()
 
-        client.delete_space(MOCK_SPACE_ID)
+    def test_close_closes_async_client(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        assert client.async_client._aclient is mock_async_client
+        client.close()
+        mock_async_client.aclose.assert_awaited_once()
 
-        mock_httpx_client.delete.assert_called_once()
-        call_args = mock_httpx_client.delete.call_args
-        assert MOCK_SPACE_ID in call_args[0][0]
+    @pytest.mark.asyncio
+    async def test_close_in_running_loop_schedules_async_close(
+        self, client: GoodmemClient, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.get.return_value = _resp(json={"embedders": []})
+        await client.alist_embedders()
 
+        client.close()
+        await asyncio.sleep(0)
 
-class TestGoodmemClientRetrieve:
-    """Tests for memory retrieval."""
+        mock_async_client.aclose.assert_awaited_once()
+
+    def test_sync_only_client_opens_no_async_client(self) -> None:
+        with patch("goodmem_adk.client.httpx.Client"), patch(
+            "goodmem_adk.client.httpx.AsyncClient"
+        ) as mock_client_class:
+            with GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY):
+                pass
+        mock_client_class.assert_not_called()
+
+
+class TestGoodmemAsyncClient:
+    """Tests for the standalone async client and its sharing with the sync one."""
 
     @pytest.fixture
-    def mock_httpx_client(self) -> MagicMock:
-        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
+    def mock_async_client(self) -> MagicMock:
+        with patch("goodmem_adk.client.httpx.AsyncClient") as mock_client_class:
             mock_client = MagicMock()
+            mock_client.get = AsyncMock()
+            mock_client.post = AsyncMock()
+            mock_client.aclose = AsyncMock()
             mock_client_class.return_value = mock_client
             yield mock_client
 
+    @pytest.mark.asyncio
+    async def test_ainsert_memory_sends_json(
+        self, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.post.return_value = _resp(json={"memoryId": MOCK_MEMORY_ID})
+
+        async with GoodmemAsyncClient(MOCK_BASE_URL, MOCK_API_KEY) as client:
+            result = await client.ainsert_memory(
+                MOCK_SPACE_ID, "test content", metadata={"key": "value"}
+            )
+
+        assert result["memoryId"] == MOCK_MEMORY_ID
+        body = _loads(mock_async_client.post.call_args.kwargs["content"])
+        assert body["originalContent"] == "test content"
+        assert body["metadata"] == {"key": "value"}
+        mock_async_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aget_space_not_found_returns_none(
+        self, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.get.return_value = _resp(status_code=404)
+
+        client = GoodmemAsyncClient(MOCK_BASE_URL, MOCK_API_KEY)
+
+        assert await client.aget_space(MOCK_SPACE_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_acreate_space_sends_chunking_config(
+        self, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.post.return_value = _resp(json={"spaceId": MOCK_SPACE_ID})
+
+        client = GoodmemAsyncClient(MOCK_BASE_URL, MOCK_API_KEY)
+        result = await client.acreate_space("test-space", MOCK_EMBEDDER_ID)
+
+        assert result["spaceId"] == MOCK_SPACE_ID
+        args, kwargs = mock_async_client.post.call_args
+        assert args[0] == "/v1/spaces"
+        body = _loads(kwargs["content"])
+        assert body["spaceEmbedders"][0]["embedderId"] == MOCK_EMBEDDER_ID
+        assert body["defaultChunkingConfig"]["recursive"]["chunkSize"] == 512
+
+    @pytest.mark.asyncio
+    async def test_adelete_space(self, mock_async_client: MagicMock) -> None:
+        mock_async_client.delete = AsyncMock(return_value=_resp(status_code=200))
+
+        client = GoodmemAsyncClient(MOCK_BASE_URL, MOCK_API_KEY)
+        await client.adelete_space(MOCK_SPACE_ID)
+
+        mock_async_client.delete.assert_awaited_once_with(
+            f"/v1/spaces/{MOCK_SPACE_ID}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_aget_memory_uses_batch_endpoint(
+        self, mock_async_client: MagicMock
+    ) -> None:
+        mock_async_client.post.return_value = _resp(json={
+            "memories": [{"memoryId": "other"}, {"memoryId": MOCK_MEMORY_ID}]
+        })
+
+        client = GoodmemAsyncClient(MOCK_BASE_URL, MOCK_API_KEY)
+        result = await client.aget_memory(MOCK_MEMORY_ID)
+
+        assert result == {"memoryId": MOCK_MEMORY_ID}
+        args, kwargs = mock_async_client.post.call_args
+        assert args[0] == "/v1/memories:batchGet"
+        assert _loads(kwargs["content"]) == {"memoryIds": [MOCK_MEMORY_ID]}
+
+    @pytest.mark.asyncio
+    async def test_sync_client_shares_retrieval_cache(
+        self, mock_async_client: MagicMock
+    ) -> None:
+        with patch("goodmem_adk.client.httpx.Client") as mock_client_class:
+            mock_client_class.return_value.stream.return_value = (
+                _stream_response(NDJSON_ONE_ITEM)
+            )
+            client = GoodmemClient(
+                MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=8
+            )
+            sync_result = client.retrieve_memories("query", ["s1"])
+
+        async_result = await client.async_client.aretrieve_memories(
+            "query", ["s1"]
+        )
+
+        assert async_result == sync_result
+        mock_async_client.stream.assert_not_called()
+
+
+class TestGoodmemClientRetrievalCache:
+    """Tests for the retrieve_memories LRU cache."""
+
     @pytest.fixture
-    def client(self, mock_httpx_client: MagicMock) -> GoodmemClient:
-        return GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+    def mock_httpx_client(
+        self, mock_httpx_client: _RecordingClient
+    ) -> _RecordingClient:
+        mock_httpx_client.on(
+            "stream", lambda *a, **kw: _stream_response(NDJSON_ONE_ITEM)
+        )
+        mock_httpx_client.returns("post", _resp(json={"memoryId": MOCK_MEMORY_ID}))
+        return mock_httpx_client
 
-    def test_retrieve_memories_parses_ndjson(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_repeated_query_hits_cache(
+        self, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        ndjson = "\n".join([
-            '{"retrievedItem": {"chunk": {"chunk": {"chunkText": "text1"}}}}',
-            '{"status": "complete"}',
-            '{"retrievedItem": {"chunk": {"chunk": {"chunkText": "text2"}}}}',
-        ])
-        mock_response.text = ndjson
-        mock_httpx_client.post.return_value = mock_response
+        client = GoodmemClient(
+            MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=8
+        )
 
-        result = client.retrieve_memories("query", [MOCK_SPACE_ID])
+        first = client.retrieve_memories("query", ["s1", "s2"])
+        second = client.retrieve_memories("query", ["s2", "s1"])
 
-        assert len(result) == 2
+        assert first == second
+        assert len(mock_httpx_client.calls_to("stream")) == 1
 
-    def test_retrieve_memories_sends_correct_payload(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_key_is_the_query_as_sent(
+        self, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.text = ""
-        mock_httpx_client.post.return_value = mock_response
+        client = GoodmemClient(
+            MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=8
+        )
 
-        client.retrieve_memories("test query", ["space1", "space2"], request_size=10)
+        client.retrieve_memories("query", ["s1"])
+        client.retrieve_memories("query ", ["s1"])
 
-        call_kwargs = mock_httpx_client.post.call_args.kwargs
-        assert call_kwargs["json"]["message"] == "test query"
-        assert call_kwargs["json"]["requestedSize"] == 10
-        assert call_kwargs["json"]["spaceKeys"] == [
-            {"spaceId": "space1"},
-            {"spaceId": "space2"},
+        assert len(mock_httpx_client.calls_to("stream")) == 2
+
+    def test_cached_results_are_copies(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(
+            MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=8
+        )
+
+        # Neither the stored result nor a returned one aliases the other.
+        client.retrieve_memories("query", ["s1"])[0]["retrievedItem"].clear()
+        cached = client.retrieve_memories("query", ["s1"])
+        cached[0]["retrievedItem"].clear()
+
+        assert client.retrieve_memories("query", ["s1"]) == [
+            {"retrievedItem": {"chunk": {"chunk": {"chunkText": "t"}}}}
         ]
+        assert len(mock_httpx_client.calls_to("stream")) == 1
 
-    def test_ndjson_empty_response(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+    def test_cache_is_off_by_default(
+        self, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.text = ""
-        mock_httpx_client.post.return_value = mock_response
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
 
-        result = client.retrieve_memories("test", ["space-1"])
-        assert len(result) == 0
+        client.retrieve_memories("query", ["s1"])
+        client.retrieve_memories("query", ["s1"])
 
-    def test_ndjson_with_blank_lines(
-        self, client: GoodmemClient, mock_httpx_client: MagicMock
+        assert len(mock_httpx_client.calls_to("stream")) == 2
+
+    def test_insert_invalidates_space(
+        self, mock_httpx_client: _RecordingClient
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.text = (
-            '\n{"retrievedItem": {"chunk": {"chunk": {"memoryId": "1", "chunkText": "First"}}}}'
-            '\n\n{"retrievedItem": {"chunk": {"chunk": {"memoryId": "2", "chunkText": "Second"}}}}\n'
+        client = GoodmemClient(
+            MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=8
         )
-        mock_httpx_client.post.return_value = mock_response
 
-        result = client.retrieve_memories("test", ["space-1"])
-        assert len(result) == 2
+        client.retrieve_memories("query", ["s1"])
+        client.insert_memory("s1", "new content")
+        client.retrieve_memories("query", ["s1"])
+
+        assert len(mock_httpx_client.calls_to("stream")) == 2
+
+    def test_cache_disabled_with_zero_size(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(
+            MOCK_BASE_URL, MOCK_API_KEY, retrieval_cache_size=0
+        )
+
+        client.retrieve_memories("query", ["s1"])
+        client.retrieve_memories("query", ["s1"])
+
+        assert len(mock_httpx_client.calls_to("stream")) == 2
+
+    def test_expired_entry_is_refetched(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(
+            MOCK_BASE_URL,
+            MOCK_API_KEY,
+            retrieval_cache_size=8,
+            retrieval_cache_ttl=0.0,
+        )
+
+        with patch("goodmem_adk.client.time.monotonic", side_effect=[0, 1, 1]):
+            client.retrieve_memories("query", ["s1"])
+            client.retrieve_memories("query", ["s1"])
+
+        assert len(mock_httpx_client.calls_to("stream")) == 2
+
+
+class TestGoodmemClientEmbedderCache:
+    """Tests for the per-client ensure_embedder cache."""
+
+    @pytest.fixture
+    def mock_httpx_client(
+        self, mock_httpx_client: _RecordingClient
+    ) -> _RecordingClient:
+        mock_httpx_client.returns(
+            "get", _resp(json={"embedders": [{"embedderId": MOCK_EMBEDDER_ID}]})
+        )
+        return mock_httpx_client
+
+    def test_resolved_embedder_is_cached(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+
+        assert client.ensure_embedder() == MOCK_EMBEDDER_ID
+        assert client.ensure_embedder() == MOCK_EMBEDDER_ID
+
+        assert len(mock_httpx_client.calls_to("get")) == 1
+
+    def test_explicit_embedder_id_is_always_validated(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+        client.ensure_embedder()
+
+        with pytest.raises(ValueError, match="not found"):
+            client.ensure_embedder(embedder_id="missing-embedder")
+
+    def test_invalidate_embedder_cache_refetches(
+        self, mock_httpx_client: _RecordingClient
+    ) -> None:
+        client = GoodmemClient(MOCK_BASE_URL, MOCK_API_KEY)
+
+        client.ensure_embedder()
+        client.invalidate_embedder_cache()
+        client.ensure_embedder()
+
+        assert len(mock_httpx_client.calls_to("get")) == 2
@@ -19,11 +19,13 @@
 
 from __future__ import annotations
 
-from typing import Generator
-from unittest.mock import MagicMock, patch
+import functools
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+from unittest.mock import call, MagicMock, Mock, patch
 
 import pytest
 from google.genai import types
+from pydantic import ValidationError
 
 from google.adk.events.event import Event
 from google.adk.memory.base_memory_service import SearchMemoryResponse
@@ -36,15 +38,14 @@ from goodmem_adk.memory import (
     GoodmemMemoryServiceConfig,
 )
 
-def _wire_ensure_embedder(mock_client: MagicMock) -> None:
+def _wire_ensure_embedder(mock_client: Mock) -> None:
     """Wire ensure_embedder on a mock so it delegates to the real impl."""
-    mock_client.ensure_embedder = (
-        lambda **kw: GoodmemClient.ensure_embedder(mock_client, **kw)
+    mock_client._embedder_id_cache = None
+    mock_client.ensure_embedder = functools.partial(
+        GoodmemClient.ensure_embedder, mock_client
     )
-    mock_client._auto_create_google_embedder = (
-        lambda **kw: GoodmemClient._auto_create_google_embedder(
-            mock_client, **kw
-        )
+    mock_client._auto_create_google_embedder = functools.partial(
+        GoodmemClient._auto_create_google_embedder, mock_client
     )
 
 
@@ -59,64 +60,155 @@ MOCK_USER_ID = "test-user"
 MOCK_SESSION_ID = "test-session"
 MOCK_MEMORY_ID = "test-memory-id"
 
-MOCK_SESSION = Session(
-    app_name=MOCK_APP_NAME,
-    user_id=MOCK_USER_ID,
-    id=MOCK_SESSION_ID,
-    last_update_time=1000,
-    events=[
-        Event(
-            id="event-1",
-            invocation_id="inv-1",
-            author="user",
-            timestamp=12345,
-            content=types.Content(
-                parts=[types.Part(text="Hello, I like Python.")]
+# Key under which the service caches the space for MOCK_APP_NAME/MOCK_USER_ID.
+_CACHE_KEY = f"{MOCK_APP_NAME}:{MOCK_USER_ID}"
+
+_CLIENT_PATCH = "goodmem_adk.memory.GoodmemClient"
+
+# Canonical configs, validated once and shared; the service only reads them.
+_CONFIG_CUSTOM = GoodmemMemoryServiceConfig(
+    top_k=20, timeout=10.0, split_turn=True,
+)
+_CONFIG_TOPK5 = GoodmemMemoryServiceConfig(top_k=5, timeout=10.0)
+
+# One retrieve_memories result item, as returned by the client.
+_SEARCH_RESPONSE_ITEMS = (
+    {
+        "retrievedItem": {
+            "chunk": {
+                "chunk": {
+                    "chunkText": "User: What is Python?\nLLM: Python is great",
+                    "memoryId": "mem-1",
+                }
+            }
+        }
+    },
+)
+
+# Default return values re-applied to the shared client mock before each test.
+_DEFAULT_RETURNS = {
+    "list_embedders": [
+        {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
+    ],
+    "list_spaces": [],
+    "create_space": {"spaceId": MOCK_SPACE_ID},
+    "insert_memory": {
+        "memoryId": MOCK_MEMORY_ID,
+        "processingStatus": "COMPLETED",
+    },
+    "insert_memory_binary": {
+        "memoryId": MOCK_MEMORY_ID,
+        "processingStatus": "PROCESSING",
+    },
+    "retrieve_memories": [],
+}
+
+
+@pytest.fixture(scope="module")
+def _patched_client_cls() -> Generator[MagicMock, None, None]:
+    """Patch GoodmemClient once for the module instead of once per test."""
+    with patch(_CLIENT_PATCH) as mock_cls:
+        client = Mock(spec_set=GoodmemClient)
+        # The partials are plain attributes, so reset_mock() leaves them be.
+        _wire_ensure_embedder(client)
+        mock_cls.return_value = client
+        yield mock_cls
+
+
+@pytest.fixture
+def mock_goodmem_client(_patched_client_cls: MagicMock) -> Mock:
+    """The shared client mock, reset to its default return values."""
+    client = _patched_client_cls.return_value
+    client.reset_mock(return_value=True, side_effect=True)
+    for name, value in _DEFAULT_RETURNS.items():
+        getattr(client, name).return_value = value
+    client._embedder_id_cache = None
+    return client
+
+
+@pytest.fixture
+def make_service(
+    mock_goodmem_client: Mock,
+) -> Callable[..., GoodmemMemoryService]:
+    """Build a service with the mock defaults, overridden by keyword."""
+
+    def _make(**overrides: Any) -> GoodmemMemoryService:
+        kwargs: Dict[str, Any] = {
+            "base_url": MOCK_BASE_URL,
+            "api_key": MOCK_API_KEY,
+            "embedder_id": MOCK_EMBEDDER_ID,
+        }
+        kwargs.update(overrides)
+        return GoodmemMemoryService(**kwargs)
+
+    return _make
+
+
+# Built lazily and shared: constructing the pydantic Event/Content objects is
+# not free, and add_session_to_memory only reads the session.
+@pytest.fixture(scope="session")
+def mock_session() -> Session:
+    """Session with two text events, one empty event and one function call."""
+    return Session(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID,
+        id=MOCK_SESSION_ID,
+        last_update_time=1000,
+        events=[
+            Event(
+                id="event-1",
+                invocation_id="inv-1",
+                author="user",
+                timestamp=12345,
+                content=types.Content(
+                    parts=(types.Part(text="Hello, I like Python."),)
+                ),
             ),
-        ),
-        Event(
-            id="event-2",
-            invocation_id="inv-2",
-            author="model",
-            timestamp=12346,
-            content=types.Content(
-                parts=[
-                    types.Part(text="Python is a great programming language.")
-                ]
+            Event(
+                id="event-2",
+                invocation_id="inv-2",
+                author="model",
+                timestamp=12346,
+                content=types.Content(
+                    parts=(
+                        types.Part(text="Python is a great programming language."),
+                    )
+                ),
             ),
-        ),
-        # Empty event, should be ignored
-        Event(
-            id="event-3",
-            invocation_id="inv-3",
-            author="user",
-            timestamp=12347,
-        ),
-        # Function call event, should be ignored
-        Event(
-            id="event-4",
-            invocation_id="inv-4",
-            author="agent",
-            timestamp=12348,
-            content=types.Content(
-                parts=[
-                    types.Part(
-                        function_call=types.FunctionCall(name="test_function")
+            # Empty event, should be ignored
+            Event(
+                id="event-3",
+                invocation_id="inv-3",
+                author="user",
+                timestamp=12347,
+            ),
+            # Function call event, should be ignored
+            Event(
+                id="event-4",
+                invocation_id="inv-4",
+                author="agent",
+                timestamp=12348,
+                content=types.Content(
+                    parts=(
+                        types.Part(
+                            function_call=types.FunctionCall(name="test_function")
+                        ),
                     )
-                ]
+                ),
             ),
-        ),
-    ],
-)
+        ],
+    )
 
-MOCK_SESSION_WITH_EMPTY_EVENTS = Session(
-    app_name=MOCK_APP_NAME,
-    user_id=MOCK_USER_ID,
-    id=MOCK_SESSION_ID,
-    last_update_time=1000,
-)
 
-_CLIENT_PATCH = "goodmem_adk.memory.GoodmemClient"
+@pytest.fixture(scope="session")
+def mock_empty_session() -> Session:
+    """Session with no events."""
+    return Session(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID,
+        id=MOCK_SESSION_ID,
+        last_update_time=1000,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -134,17 +226,15 @@ class TestGoodmemMemoryServiceConfig:
         assert config.split_turn is False
 
     def test_custom_config(self) -> None:
-        config = GoodmemMemoryServiceConfig(
-            top_k=20, timeout=10.0, split_turn=True,
-        )
+        config = _CONFIG_CUSTOM
         assert config.top_k == 20
         assert config.timeout == 10.0
         assert config.split_turn is True
 
     def test_config_validation_top_k(self) -> None:
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             GoodmemMemoryServiceConfig(top_k=0)
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError):
             GoodmemMemoryServiceConfig(top_k=101)
 
 
@@ -156,123 +246,78 @@ class TestGoodmemMemoryServiceConfig:
 class TestGoodmemMemoryService:
     """Tests for GoodmemMemoryService."""
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> Generator[MagicMock, None, None]:
-        with patch(_CLIENT_PATCH) as mock_cls:
-            client = MagicMock()
-            client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            client.list_spaces.return_value = []
-            client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            client.insert_memory.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-                "processingStatus": "COMPLETED",
-            }
-            client.insert_memory_binary.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-                "processingStatus": "PROCESSING",
-            }
-            client.retrieve_memories.return_value = []
-            _wire_ensure_embedder(client)
-            mock_cls.return_value = client
-            yield client
-
     @pytest.fixture
     def memory_service(
-        self, mock_goodmem_client: MagicMock
+        self,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> GoodmemMemoryService:
-        return GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
+        return make_service()
 
     @pytest.fixture
     def memory_service_with_config(
-        self, mock_goodmem_client: MagicMock
+        self,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> GoodmemMemoryService:
-        config = GoodmemMemoryServiceConfig(top_k=5, timeout=10.0)
-        return GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            config=config,
-        )
+        return make_service(config=_CONFIG_TOPK5)
 
     # -- constructor / lazy init ------------------------------------------------
 
     def test_service_initialization_no_network_call(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> None:
-        GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
+        make_service()
         mock_goodmem_client.list_embedders.assert_not_called()
         mock_goodmem_client.list_spaces.assert_not_called()
 
-    def test_service_initialization_requires_api_key(self) -> None:
+    def test_service_initialization_requires_api_key(
+        self,
+        make_service: Callable[..., GoodmemMemoryService],
+    ) -> None:
         with pytest.raises(ValueError, match="api_key is required"):
-            GoodmemMemoryService(base_url=MOCK_BASE_URL, api_key="")
+            make_service(api_key="")
 
     # -- embedder resolution ----------------------------------------------------
 
     def test_embedder_resolved_on_first_space_creation(
-        self, mock_goodmem_client: MagicMock
+        self,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> None:
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
+        service = make_service()
         assert service._resolved_embedder_id is None
         service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
         assert service._resolved_embedder_id == MOCK_EMBEDDER_ID
 
-    def test_embedder_uses_first_available(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.list_embedders.return_value = [
-            {"embedderId": "first-emb", "name": "First"},
-            {"embedderId": "second-emb", "name": "Second"},
-        ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL, api_key=MOCK_API_KEY,
-        )
-        service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert service._resolved_embedder_id == "first-emb"
-
     def test_no_embedders_and_no_api_key_fails(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """When no embedders exist and GOOGLE_API_KEY is unset, raises."""
         mock_goodmem_client.list_embedders.return_value = []
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL, api_key=MOCK_API_KEY,
-        )
-        with patch.dict(
-            "os.environ",
-            {"GOOGLE_API_KEY": "", "GEMINI_API_KEY": ""},
-            clear=False,
-        ):
-            with pytest.raises(ValueError, match="No embedders available"):
-                service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
+        monkeypatch.setenv("GOOGLE_API_KEY", "")
+        monkeypatch.setenv("GEMINI_API_KEY", "")
+        service = make_service(embedder_id=None)
+        with pytest.raises(ValueError, match="No embedders available"):
+            service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
 
     # -- space management -------------------------------------------------------
 
     def test_ensure_space_creates_new_space(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
         space_id = memory_service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
 
-        mock_goodmem_client.list_spaces.assert_called_once_with(
-            name=MOCK_SPACE_NAME
-        )
-        mock_goodmem_client.create_space.assert_called_once_with(
+        list_spaces = mock_goodmem_client.list_spaces
+        assert list_spaces.call_count == 1
+        assert list_spaces.call_args.kwargs == {"name": MOCK_SPACE_NAME}
+        create_space = mock_goodmem_client.create_space
+        assert create_space.call_count == 1
+        assert create_space.call_args.args == (
             MOCK_SPACE_NAME, MOCK_EMBEDDER_ID
         )
         assert space_id == MOCK_SPACE_ID
@@ -280,7 +325,7 @@ class TestGoodmemMemoryService:
     def test_ensure_space_uses_existing_space(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "existing-space-id", "name": MOCK_SPACE_NAME}
@@ -292,23 +337,22 @@ class TestGoodmemMemoryService:
     def test_ensure_space_uses_cache(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        cache_key = f"{MOCK_APP_NAME}:{MOCK_USER_ID}"
-        memory_service._space_cache[cache_key] = "cached-space-id"
+        memory_service._space_cache[_CACHE_KEY] = "cached-space-id"
         space_id = memory_service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
         mock_goodmem_client.list_spaces.assert_not_called()
         assert space_id == "cached-space-id"
 
     # -- add_session_to_memory --------------------------------------------------
 
-    @pytest.mark.asyncio
     async def test_add_session_to_memory_success(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
+        mock_session: Session,
     ) -> None:
-        await memory_service.add_session_to_memory(MOCK_SESSION)
+        await memory_service.add_session_to_memory(mock_session)
         mock_goodmem_client.insert_memory.assert_called_once()
         call_kw = mock_goodmem_client.insert_memory.call_args.kwargs
         assert "User: Hello, I like Python." in call_kw["content"]
@@ -317,40 +361,25 @@ class TestGoodmemMemoryService:
             in call_kw["content"]
         )
 
-    @pytest.mark.asyncio
     async def test_add_session_filters_empty_events(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
+        mock_empty_session: Session,
     ) -> None:
-        await memory_service.add_session_to_memory(
-            MOCK_SESSION_WITH_EMPTY_EVENTS
-        )
+        await memory_service.add_session_to_memory(mock_empty_session)
         mock_goodmem_client.insert_memory.assert_not_called()
 
     # -- search_memory ----------------------------------------------------------
 
-    @pytest.mark.asyncio
     async def test_search_memory_success(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        mock_goodmem_client.retrieve_memories.return_value = [
-            {
-                "retrievedItem": {
-                    "chunk": {
-                        "chunk": {
-                            "chunkText": (
-                                "User: What is Python?\n"
-                                "LLM: Python is great"
-                            ),
-                            "memoryId": "mem-1",
-                        }
-                    }
-                }
-            },
-        ]
+        mock_goodmem_client.retrieve_memories.return_value = list(
+            _SEARCH_RESPONSE_ITEMS
+        )
 
         result = await memory_service.search_memory(
             app_name=MOCK_APP_NAME,
@@ -358,19 +387,18 @@ class TestGoodmemMemoryService:
             query="Python programming",
         )
 
-        mock_goodmem_client.retrieve_memories.assert_called_once_with(
-            query="Python programming",
-            space_ids=[MOCK_SPACE_ID],
-            request_size=5,
-        )
+        retrieve = mock_goodmem_client.retrieve_memories
+        assert retrieve.call_count == 1
+        assert retrieve.call_args.kwargs["query"] == "Python programming"
+        assert retrieve.call_args.kwargs["space_ids"] == [MOCK_SPACE_ID]
+        assert retrieve.call_args.kwargs["request_size"] == 5
         assert len(result.memories) == 1
         assert "Python is great" in result.memories[0].content.parts[0].text
 
-    @pytest.mark.asyncio
     async def test_search_memory_error_handling(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
         mock_goodmem_client.retrieve_memories.side_effect = Exception(
             "API Error"
@@ -384,11 +412,10 @@ class TestGoodmemMemoryService:
 
     # -- close ------------------------------------------------------------------
 
-    @pytest.mark.asyncio
     async def test_close_calls_client_close(
         self,
         memory_service: GoodmemMemoryService,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
         await memory_service.close()
         mock_goodmem_client.close.assert_called_once()
@@ -399,213 +426,158 @@ class TestGoodmemMemoryService:
 # ---------------------------------------------------------------------------
 
 
-class TestMemoryServiceSpaceResolution:
-    """Tests for space_id / space_name override in memory service."""
+# Each case: constructor kwargs, env overrides, mock return values, the
+# lookup call expected on the client, then the resolved id or, when the
+# resolution must fail, the ValueError match.
+_SPACE_RESOLUTION_CASES = [
+    pytest.param(
+        {"space_id": "direct-id"},
+        {},
+        {"get_space": {"spaceId": "direct-id", "name": "some-space"}},
+        ("get_space", call("direct-id")),
+        "direct-id",
+        None,
+        id="space_id_exists",
+    ),
+    pytest.param(
+        {"space_id": "nonexistent-id"},
+        {},
+        {"get_space": None},
+        ("get_space", call("nonexistent-id")),
+        None,
+        "not found",
+        id="space_id_not_found_raises",
+    ),
+    pytest.param(
+        {},
+        {"GOODMEM_SPACE_ID": "env-id"},
+        {"get_space": {"spaceId": "env-id", "name": "env-space"}},
+        ("get_space", call("env-id")),
+        "env-id",
+        None,
+        id="space_id_env_var",
+    ),
+    pytest.param(
+        {"space_id": "param-id"},
+        {"GOODMEM_SPACE_ID": "env-id"},
+        {"get_space": {"spaceId": "param-id", "name": "param-space"}},
+        ("get_space", call("param-id")),
+        "param-id",
+        None,
+        id="space_id_param_overrides_env",
+    ),
+    pytest.param(
+        {"space_name": "custom_name"},
+        {},
+        {"list_spaces": [{"spaceId": "custom-id", "name": "custom_name"}]},
+        ("list_spaces", call(name="custom_name")),
+        "custom-id",
+        None,
+        id="space_name_overrides_default",
+    ),
+    pytest.param(
+        {},
+        {"GOODMEM_SPACE_NAME": "env_name"},
+        {"list_spaces": [{"spaceId": "env-name-id", "name": "env_name"}]},
+        ("list_spaces", call(name="env_name")),
+        "env-name-id",
+        None,
+        id="space_name_env_var",
+    ),
+    pytest.param(
+        {"space_id": "same-id", "space_name": "my_space"},
+        {},
+        {"list_spaces": [{"spaceId": "same-id", "name": "my_space"}]},
+        ("list_spaces", call(name="my_space")),
+        "same-id",
+        None,
+        id="space_id_and_name_matching",
+    ),
+    pytest.param(
+        {"space_id": "wrong-id", "space_name": "my_space"},
+        {},
+        {"list_spaces": [{"spaceId": "other-id", "name": "my_space"}]},
+        ("list_spaces", call(name="my_space")),
+        None,
+        "refer to different spaces",
+        id="space_id_and_name_mismatch_raises",
+    ),
+    pytest.param(
+        {"space_id": "some-id", "space_name": "nonexistent"},
+        {},
+        {"list_spaces": []},
+        ("list_spaces", call(name="nonexistent")),
+        None,
+        "does not match any existing space",
+        id="space_id_and_name_not_found_raises",
+    ),
+]
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> Generator[MagicMock, None, None]:
-        with patch(_CLIENT_PATCH) as mock_cls:
-            client = MagicMock()
-            client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            client.list_spaces.return_value = []
-            client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            client.insert_memory.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-            }
-            client.retrieve_memories.return_value = []
-            _wire_ensure_embedder(client)
-            mock_cls.return_value = client
-            yield client
 
-    def test_space_id_exists(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        """space_id set and space exists → used directly, no create."""
-        mock_goodmem_client.get_space.return_value = {
-            "spaceId": "direct-id", "name": "some-space"
-        }
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="direct-id",
-        )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "direct-id"
-        mock_goodmem_client.get_space.assert_called_once_with("direct-id")
-        mock_goodmem_client.list_spaces.assert_not_called()
-        mock_goodmem_client.create_space.assert_not_called()
-
-    def test_space_id_not_found_raises(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        """space_id set but doesn't exist → ValueError."""
-        mock_goodmem_client.get_space.return_value = None
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="nonexistent-id",
-        )
-        with pytest.raises(ValueError, match="not found"):
-            service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        mock_goodmem_client.get_space.assert_called_once_with("nonexistent-id")
-        mock_goodmem_client.create_space.assert_not_called()
-
-    def test_space_id_env_var(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.get_space.return_value = {
-            "spaceId": "env-id", "name": "env-space"
-        }
-        with patch.dict(
-            "os.environ", {"GOODMEM_SPACE_ID": "env-id"}, clear=False
-        ):
-            service = GoodmemMemoryService(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-            )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "env-id"
-        mock_goodmem_client.get_space.assert_called_once_with("env-id")
-        mock_goodmem_client.list_spaces.assert_not_called()
-
-    def test_space_name_overrides_default(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.list_spaces.return_value = [
-            {"spaceId": "custom-id", "name": "custom_name"}
-        ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_name="custom_name",
-        )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "custom-id"
-        mock_goodmem_client.list_spaces.assert_called_once_with(
-            name="custom_name"
-        )
-
-    def test_space_name_env_var(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.list_spaces.return_value = [
-            {"spaceId": "env-name-id", "name": "env_name"}
-        ]
-        with patch.dict(
-            "os.environ", {"GOODMEM_SPACE_NAME": "env_name"}, clear=False
-        ):
-            service = GoodmemMemoryService(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-            )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "env-name-id"
+class TestMemoryServiceSpaceResolution:
+    """Tests for space_id / space_name override in memory service."""
 
-    def test_space_id_and_name_matching(
-        self, mock_goodmem_client: MagicMock
+    @pytest.mark.parametrize(
+        "ctor_kwargs, env, mock_returns, lookup, expected, err_match",
+        _SPACE_RESOLUTION_CASES,
+    )
+    def test_space_resolution(
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
+        monkeypatch: pytest.MonkeyPatch,
+        ctor_kwargs: Dict[str, Any],
+        env: Dict[str, str],
+        mock_returns: Dict[str, Any],
+        lookup: Tuple[str, Any],
+        expected: Optional[str],
+        err_match: Optional[str],
     ) -> None:
-        mock_goodmem_client.list_spaces.return_value = [
-            {"spaceId": "same-id", "name": "my_space"}
-        ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="same-id",
-            space_name="my_space",
-        )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "same-id"
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        for method, value in mock_returns.items():
+            getattr(mock_goodmem_client, method).return_value = value
+        service = make_service(**ctor_kwargs)
+
+        if err_match is None:
+            result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
+            assert result == expected
+        else:
+            with pytest.raises(ValueError, match=err_match):
+                service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
 
-    def test_space_id_and_name_mismatch_raises(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.list_spaces.return_value = [
-            {"spaceId": "other-id", "name": "my_space"}
+        method, expected_call = lookup
+        assert getattr(mock_goodmem_client, method).call_args_list == [
+            expected_call
         ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="wrong-id",
-            space_name="my_space",
-        )
-        with pytest.raises(ValueError, match="refer to different spaces"):
-            service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-
-    def test_space_id_and_name_not_found_raises(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.list_spaces.return_value = []
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="some-id",
-            space_name="nonexistent",
-        )
-        with pytest.raises(
-            ValueError, match="does not match any existing space"
-        ):
-            service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
+        if method == "get_space":
+            mock_goodmem_client.list_spaces.assert_not_called()
+        mock_goodmem_client.create_space.assert_not_called()
 
     def test_space_id_validation_runs_once(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "same-id", "name": "my_space"}
         ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="same-id",
-            space_name="my_space",
-        )
+        service = make_service(space_id="same-id", space_name="my_space")
         service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
         service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
         mock_goodmem_client.list_spaces.assert_called_once()
 
-    def test_space_id_param_overrides_env(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        mock_goodmem_client.get_space.return_value = {
-            "spaceId": "param-id", "name": "param-space"
-        }
-        with patch.dict(
-            "os.environ", {"GOODMEM_SPACE_ID": "env-id"}, clear=False
-        ):
-            service = GoodmemMemoryService(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-                space_id="param-id",
-            )
-        result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert result == "param-id"
-        mock_goodmem_client.get_space.assert_called_once_with("param-id")
-
     def test_space_name_auto_creates_if_not_exists(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> None:
         """space_name auto-creates the space when it doesn't exist."""
         mock_goodmem_client.list_spaces.return_value = []
         mock_goodmem_client.create_space.return_value = {
             "spaceId": "new-custom-id"
         }
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_name="my_custom_space",
-        )
+        service = make_service(space_name="my_custom_space")
         result = service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
 
         assert result == "new-custom-id"
@@ -625,73 +597,76 @@ class TestMemoryServiceSpaceResolution:
 class TestMemoryServiceEmbedderPriority:
     """Tests for embedder resolution priority in the memory service."""
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> Generator[MagicMock, None, None]:
-        with patch(_CLIENT_PATCH) as mock_cls:
-            client = MagicMock()
-            client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            client.list_spaces.return_value = []
-            client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            client.insert_memory.return_value = {"memoryId": MOCK_MEMORY_ID}
-            client.retrieve_memories.return_value = []
-            _wire_ensure_embedder(client)
-            mock_cls.return_value = client
-            yield client
-
-    def test_embedder_id_specified_and_valid(
-        self, mock_goodmem_client: MagicMock
+    @pytest.mark.parametrize(
+        "embedder_arg, embedders, expected",
+        [
+            pytest.param(
+                MOCK_EMBEDDER_ID,
+                [{"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}],
+                MOCK_EMBEDDER_ID,
+                id="specified_and_valid",
+            ),
+            pytest.param(
+                None,
+                [
+                    {"embedderId": "first-emb", "name": "First"},
+                    {"embedderId": "second-emb", "name": "Second"},
+                ],
+                "first-emb",
+                id="uses_first_available",
+            ),
+        ],
+    )
+    def test_embedder_resolution(
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
+        embedder_arg: Optional[str],
+        embedders: List[Dict[str, str]],
+        expected: str,
     ) -> None:
-        """GOODMEM_EMBEDDER_ID if set and valid → used."""
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
+        """A valid GOODMEM_EMBEDDER_ID is used, else the first embedder."""
+        mock_goodmem_client.list_embedders.return_value = embedders
+        service = make_service(embedder_id=embedder_arg)
         service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
-        assert service._resolved_embedder_id == MOCK_EMBEDDER_ID
+        assert service._resolved_embedder_id == expected
         mock_goodmem_client.create_space.assert_called_once_with(
-            MOCK_SPACE_NAME, MOCK_EMBEDDER_ID
+            MOCK_SPACE_NAME, expected
         )
 
     def test_embedder_id_specified_invalid_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
     ) -> None:
         """GOODMEM_EMBEDDER_ID if set but not found → ValueError."""
         mock_goodmem_client.list_embedders.return_value = [
             {"embedderId": "other-emb", "name": "Other"}
         ]
-        service = GoodmemMemoryService(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id="nonexistent-emb",
-        )
+        service = make_service(embedder_id="nonexistent-emb")
         with pytest.raises(ValueError, match="not found"):
             service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
         mock_goodmem_client.create_embedder.assert_not_called()
 
     def test_auto_create_embedder_with_google_api_key(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_service: Callable[..., GoodmemMemoryService],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """No embedders + GOOGLE_API_KEY → auto-create gemini embedder."""
         mock_goodmem_client.list_embedders.return_value = []
         mock_goodmem_client.create_embedder.return_value = {
             "embedderId": "auto-created-emb"
         }
-        with patch.dict(
-            "os.environ",
-            {"GOOGLE_API_KEY": "test-google-key"},
-            clear=False,
-        ):
-            service = GoodmemMemoryService(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-            )
-            service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-google-key")
+        service = make_service(embedder_id=None)
+        service._ensure_space(MOCK_APP_NAME, MOCK_USER_ID)
 
-        mock_goodmem_client.create_embedder.assert_called_once()
-        mock_goodmem_client.create_space.assert_called_once_with(
+        assert mock_goodmem_client.create_embedder.call_count == 1
+        create_space = mock_goodmem_client.create_space
+        assert create_space.call_count == 1
+        assert create_space.call_args.args == (
             MOCK_SPACE_NAME, "auto-created-emb"
         )
 
@@ -701,6 +676,30 @@ class TestMemoryServiceEmbedderPriority:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def entry_with_timestamp() -> MemoryEntry:
+    return MemoryEntry(
+        id="mem-123",
+        content=types.Content(
+            parts=[
+                types.Part(
+                    text="User: My favorite color is blue.\nLLM: I'll remember."
+                )
+            ]
+        ),
+        timestamp="2025-02-05 14:30",
+    )
+
+
+@pytest.fixture(scope="session")
+def entry_without_timestamp() -> MemoryEntry:
+    return MemoryEntry(
+        id="mem-456",
+        content=types.Content(parts=[types.Part(text="User: Hello.")]),
+        timestamp=None,
+    )
+
+
 class TestFormatMemoryBlockForPrompt:
     """Tests for format_memory_block_for_prompt."""
 
@@ -710,30 +709,18 @@ class TestFormatMemoryBlockForPrompt:
         assert "BEGIN MEMORY" in block
         assert "END MEMORY" in block
 
-    def test_one_chunk_with_timestamp(self) -> None:
-        entry = MemoryEntry(
-            id="mem-123",
-            content=types.Content(
-                parts=[
-                    types.Part(
-                        text="User: My favorite color is blue.\nLLM: I'll remember."
-                    )
-                ]
-            ),
-            timestamp="2025-02-05 14:30",
-        )
-        response = SearchMemoryResponse(memories=[entry])
+    def test_one_chunk_with_timestamp(
+        self, entry_with_timestamp: MemoryEntry
+    ) -> None:
+        response = SearchMemoryResponse(memories=[entry_with_timestamp])
         block = format_memory_block_for_prompt(response)
         assert "- id: mem-123" in block
         assert "My favorite color is blue." in block
 
-    def test_chunk_without_timestamp(self) -> None:
-        entry = MemoryEntry(
-            id="mem-456",
-            content=types.Content(parts=[types.Part(text="User: Hello.")]),
-            timestamp=None,
-        )
-        response = SearchMemoryResponse(memories=[entry])
+    def test_chunk_without_timestamp(
+        self, entry_without_timestamp: MemoryEntry
+    ) -> None:
+        response = SearchMemoryResponse(memories=[entry_without_timestamp])
         block = format_memory_block_for_prompt(response)
         assert "- id: mem-456" in block
         assert "User: Hello." in block
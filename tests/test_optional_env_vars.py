@@ -27,6 +27,12 @@ Run with::
     GOOGLE_API_KEY=<key> \
     pytest tests/test_optional_env_vars.py -v
 
+Every test uses its own uniquely named space, so the module can be spread
+across workers with ``-n auto --dist loadgroup``.
+
+Session prompts and responses are logged at DEBUG level; add
+``-o log_cli=true --log-cli-level=DEBUG`` to follow them live.
+
 Either GOOGLE_API_KEY or GEMINI_API_KEY can be used for Gemini authentication.
 Optional env vars (GOODMEM_SPACE_ID, GOODMEM_SPACE_NAME, GOODMEM_EMBEDDER_ID)
 should be **unset** — the tests manage them internally via constructor params
@@ -35,14 +41,22 @@ and monkeypatch.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import re
+import secrets
 import time
-import uuid
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from types import SimpleNamespace
+from typing import List, NamedTuple, Optional, Tuple
 
+import httpx
 import pytest
 from google.adk.agents import LlmAgent
 from google.adk.apps.app import App
+from google.adk.events.event import Event
 from google.adk.runners import InMemoryRunner
 from google.genai import types
 
@@ -61,7 +75,8 @@ _HAS_GOOGLE_KEY = bool(os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY"
 
 pytestmark = [
     pytest.mark.integration,
-    pytest.mark.asyncio,
+    # One event loop for the module instead of a new one per test.
+    pytest.mark.asyncio(loop_scope="module"),
     pytest.mark.skipif(
         not (os.getenv("GOODMEM_BASE_URL") and os.getenv("GOODMEM_API_KEY")
              and _HAS_GOOGLE_KEY),
@@ -76,31 +91,35 @@ pytestmark = [
 # Helpers
 # ---------------------------------------------------------------------------
 
+logger = logging.getLogger("goodmem.integ")
+
 _BASE_URL = os.getenv("GOODMEM_BASE_URL", "http://localhost:8080")
 _API_KEY = os.getenv("GOODMEM_API_KEY", "")
-_INDEX_WAIT = 5
-_GOLDFISH_KEYWORDS = ["water", "goldfish", "fish", "aquatic", "aquarium"]
+# Upper bound on waiting for a write to become retrievable; matches
+# _INDEX_TIMEOUT in test_integration.py.
+_INDEX_WAIT = 30
+_INDEX_POLL_INTERVAL = 0.25
+_GOLDFISH_RE = re.compile(r"water|goldfish|fish|aquatic|aquarium", re.IGNORECASE)
+_MODEL = "gemini-2.5-flash"
+_DEFAULT_INSTRUCTION = "Answer questions based on what you know."
+_FETCH_INSTRUCTION = (
+    "You have access to memory tools. "
+    "When the user asks a question, ALWAYS use the goodmem_fetch "
+    "tool first to check what you know."
+)
 
 
 def _unique_name(prefix: str) -> str:
-    return f"{prefix}_{uuid.uuid4().hex[:8]}"
-
-
-def _extract_final_response(events: list) -> str:
-    text_parts: List[str] = []
-    for event in events:
-        content = getattr(event, "content", None)
-        if content is None:
-            continue
-        if getattr(event, "author", None) == "user":
-            continue
-        parts = getattr(content, "parts", None)
-        if not parts:
-            continue
-        for part in parts:
-            if getattr(part, "text", None):
-                text_parts.append(part.text)
-    return " ".join(text_parts)
+    return f"{prefix}_{secrets.token_hex(4)}"
+
+
+def _event_text(event: Event) -> str:
+    """Join the text parts of ``event``'s content."""
+    content = getattr(event, "content", None)
+    parts = getattr(content, "parts", None) if content is not None else None
+    if not parts:
+        return ""
+    return " ".join(part.text for part in parts if getattr(part, "text", None))
 
 
 def _find_space_id(client: GoodmemClient, space_name: str) -> str | None:
@@ -111,47 +130,105 @@ def _find_space_id(client: GoodmemClient, space_name: str) -> str | None:
     return None
 
 
-def _get_first_embedder_id(client: GoodmemClient) -> str | None:
-    embedders = client.list_embedders()
-    if embedders:
-        return embedders[0].get("embedderId")
-    return None
-
-
-def _pre_create_space(
-    client: GoodmemClient, space_name: str
+async def _pre_create_space(
+    client: GoodmemClient, space_name: str, embedder_id: str | None = None
 ) -> str:
-    """Create a space and return its space_id.  Resolves embedder automatically."""
-    embedder_id = client.ensure_embedder(debug=False)
-    result = client.create_space(space_name, embedder_id)
+    """Create a space and return its space_id.
+
+    Resolves the embedder automatically unless ``embedder_id`` is given. The
+    sync client runs in a worker thread so the shared module loop stays free,
+    and several creates can be overlapped with ``asyncio.gather``.
+    """
+    if embedder_id is None:
+        embedder_id = await asyncio.to_thread(
+            client.ensure_embedder, debug=False
+        )
+    result = await asyncio.to_thread(
+        client.create_space, space_name, embedder_id
+    )
     return result["spaceId"]
 
 
+def _bare_context(user_id: str = "error_user") -> SimpleNamespace:
+    """Just enough of a callback context for ``GoodmemPlugin._get_space_id``."""
+    return SimpleNamespace(state={}, user_id=user_id)
+
+
+def _plugin_runner(
+    name: str, plugin: GoodmemPlugin, instruction: str = _DEFAULT_INSTRUCTION
+) -> InMemoryRunner:
+    """Build an agent + ``plugin`` app named after ``name``."""
+    agent = LlmAgent(
+        model=_MODEL, name=f"{name}_agent", instruction=instruction,
+    )
+    app = App(name=f"{name}_app", root_agent=agent, plugins=[plugin])
+    return InMemoryRunner(app=app)
+
+
+def _tools_runner(
+    name: str, fetch_tool: GoodmemFetchTool
+) -> InMemoryRunner:
+    """Build an agent that reads memory through ``fetch_tool``."""
+    agent = LlmAgent(
+        model=_MODEL, name=f"{name}_agent",
+        instruction=_FETCH_INSTRUCTION, tools=[fetch_tool],
+    )
+    return InMemoryRunner(agent=agent, app_name=f"{name}_app")
+
+
 # ---------------------------------------------------------------------------
 # Shared fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _goodmem_reachable() -> None:
+    """Skip the module up front when nothing answers at ``_BASE_URL``.
+
+    Any HTTP response counts, even 401: only a transport failure means the
+    server is down, and auth problems should still fail loudly.
+    """
+    try:
+        httpx.head(f"{_BASE_URL}/v1/embedders", timeout=2.0)
+    except httpx.TransportError as e:
+        pytest.skip(f"Goodmem unreachable at {_BASE_URL}: {e}")
+
+
+@pytest.fixture(scope="module")
+def gm_client():
+    """One pooled client for the setup, lookups and deletes in this module.
+
+    The retrieval cache stays off (the default) so indexing polls always
+    reach the server.
+    """
+    client = GoodmemClient(_BASE_URL, _API_KEY)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def default_embedder_id(gm_client: GoodmemClient) -> str:
+    """Resolve (or auto-create) an embedder once for the whole module."""
+    return gm_client.ensure_embedder(debug=False)
+
+
 @pytest.fixture()
-def cleanup_spaces():
+def cleanup_spaces(gm_client: GoodmemClient):
     """Collect space IDs during the test and delete them in teardown."""
     space_ids: List[str] = []
     yield space_ids
-    client = GoodmemClient(_BASE_URL, _API_KEY)
-    for sid in space_ids:
+    if not space_ids:
+        return
+
+    def _delete(sid: str) -> None:
         try:
-            client.delete_space(sid)
+            gm_client.delete_space(sid)
         except Exception:
             pass
-    client.close()
 
-
-@pytest.fixture()
-def gm_client():
-    """Provide a GoodmemClient for test setup, closed after the test."""
-    client = GoodmemClient(_BASE_URL, _API_KEY)
-    yield client
-    client.close()
+    # Deletes are independent round-trips; overlap them on the shared pool.
+    with ThreadPoolExecutor(max_workers=min(8, len(space_ids))) as executor:
+        list(executor.map(_delete, space_ids))
 
 
 # ---------------------------------------------------------------------------
@@ -159,145 +236,201 @@ def gm_client():
 # ---------------------------------------------------------------------------
 
 
-async def _run_goldfish_session1_plugin(runner, app_name, user_id="goldfish_user"):
-    """Session 1: tell the agent 'I am a goldfish' via plugin."""
+async def _run_goldfish(runner, prompt, *, label, user_id="goldfish_user"):
+    """Send ``prompt`` in a fresh session and return the final response text."""
     session = await runner.session_service.create_session(
-        app_name=app_name, user_id=user_id
+        app_name=runner.app_name, user_id=user_id
     )
-    print(f"\n{'=' * 72}")
-    print(f"[ENVVAR] SESSION 1  (id={session.id})")
-    print(f"{'=' * 72}")
+    logger.debug("[ENVVAR] %s (id=%s)", label, session.id)
+
+    msg = types.Content(role="user", parts=[types.Part(text=prompt)])
+    response = ""
+    # Stop at the agent's final response; aclosing() shuts the runner's
+    # generator down cleanly instead of leaving it for the GC.
+    async with aclosing(
+        runner.run_async(
+            user_id=user_id, session_id=session.id, new_message=msg,
+        )
+    ) as events:
+        async for event in events:
+            if event.author != "user" and event.is_final_response():
+                response = _event_text(event)
+                break
+
+    logger.debug("[ENVVAR] %s response: %s", label, response)
+    return response
+
 
-    msg = types.Content(
-        role="user", parts=[types.Part(text="I am a goldfish")]
+async def _run_goldfish_session1_plugin(runner, user_id="goldfish_user"):
+    """Session 1: tell the agent 'I am a goldfish' via plugin."""
+    response = await _run_goldfish(
+        runner, "I am a goldfish", label="SESSION 1", user_id=user_id
     )
-    events = []
-    async for event in runner.run_async(
-        user_id=user_id, session_id=session.id, new_message=msg,
-    ):
-        events.append(event)
-
-    response = _extract_final_response(events)
-    print(f"[ENVVAR] Session 1 response: {response}")
     assert response, "Session 1 should produce a model response"
     return response
 
 
-async def _run_goldfish_session2_plugin(runner, app_name, user_id="goldfish_user"):
+async def _run_goldfish_session2_plugin(runner, user_id="goldfish_user"):
     """Session 2: ask 'Do I live in water?' via plugin."""
-    session = await runner.session_service.create_session(
-        app_name=app_name, user_id=user_id
+    return await _run_goldfish(
+        runner, "Do I live in water?", label="SESSION 2", user_id=user_id
     )
-    print(f"\n{'=' * 72}")
-    print(f"[ENVVAR] SESSION 2  (id={session.id})")
-    print(f"{'=' * 72}")
-
-    msg = types.Content(
-        role="user", parts=[types.Part(text="Do I live in water?")]
-    )
-    events = []
-    async for event in runner.run_async(
-        user_id=user_id, session_id=session.id, new_message=msg,
-    ):
-        events.append(event)
-
-    response = _extract_final_response(events)
-    print(f"[ENVVAR] Session 2 response: {response}")
-    return response
 
 
-async def _run_goldfish_session2_tools(runner, app_name, user_id="goldfish_user"):
+async def _run_goldfish_session2_tools(runner, user_id="goldfish_user"):
     """Session 2: ask 'Do I live in water? Check your memory.' via tools."""
-    session = await runner.session_service.create_session(
-        app_name=app_name, user_id=user_id
+    return await _run_goldfish(
+        runner, "Do I live in water? Check your memory.",
+        label="SESSION 2", user_id=user_id,
     )
-    print(f"\n{'=' * 72}")
-    print(f"[ENVVAR] SESSION 2  (id={session.id})")
-    print(f"{'=' * 72}")
-
-    msg = types.Content(
-        role="user",
-        parts=[types.Part(text="Do I live in water? Check your memory.")],
-    )
-    events = []
-    async for event in runner.run_async(
-        user_id=user_id, session_id=session.id, new_message=msg,
-    ):
-        events.append(event)
-
-    response = _extract_final_response(events)
-    print(f"[ENVVAR] Session 2 response: {response}")
-    return response
 
 
 def _assert_goldfish_recalled(response: str) -> None:
-    response_lower = response.lower()
-    assert any(kw in response_lower for kw in _GOLDFISH_KEYWORDS), (
+    assert _GOLDFISH_RE.search(response), (
         f"Expected the LLM to recall the goldfish fact. Got: {response}"
     )
 
 
-def _wait_for_indexing() -> None:
-    print(f"\n{'- ' * 36}")
-    print(f"[ENVVAR] Waiting {_INDEX_WAIT}s for Goodmem indexing...")
-    print(f"{'- ' * 36}")
-    time.sleep(_INDEX_WAIT)
+async def _wait_for_indexing(
+    client: GoodmemClient,
+    space_id: str,
+    query: str = "goldfish",
+    timeout: float = _INDEX_WAIT,
+) -> None:
+    """Poll retrieval until a chunk containing ``query`` comes back.
+
+    Any chunk is not enough: an unrelated memory in the space could match
+    before the one under test is indexed. Fails the test once ``timeout``
+    seconds pass without a match. ``client`` should keep the retrieval
+    cache off (the default) so each poll reaches the server; polls run the
+    sync client in a worker thread because the module fixture can only
+    close the sync transport.
+    """
+    logger.debug("[ENVVAR] Waiting up to %ss for Goodmem indexing...", timeout)
+    deadline = time.monotonic() + timeout
+    while True:
+        chunks = await asyncio.to_thread(
+            client.retrieve_memories, query, [space_id]
+        )
+        if any(
+            query.lower()
+            in item["retrievedItem"]["chunk"]["chunk"]["chunkText"].lower()
+            for item in chunks
+        ):
+            return
+        if time.monotonic() >= deadline:
+            pytest.fail(
+                f"Goodmem did not return a chunk containing {query!r} in "
+                f"space {space_id} within {timeout}s"
+            )
+        await asyncio.sleep(_INDEX_POLL_INTERVAL)
 
 
 # ===================================================================
-# Group A: Space Resolution — Happy Paths
+# Groups A, D, E: Happy Paths — two-session recall
 # ===================================================================
 
 
-class TestSpaceResolutionHappy:
+class _HappyCase(NamedTuple):
+    """How a two-session recall case points its plugin at a space.
 
-    async def test_a2_space_id_only_pre_created(
-        self, cleanup_spaces: List[str], gm_client: GoodmemClient
-    ) -> None:
-        """A2: Pin a pre-existing space by ID. Both sessions use space_id."""
-        space_name = _unique_name("envvar_a2")
-        space_id = _pre_create_space(gm_client, space_name)
-        cleanup_spaces.append(space_id)
+    ``params`` names the constructor arguments the plugin gets (from
+    ``space_id``, ``space_name`` and ``embedder_id``); ``env_var``, when set,
+    is exported with the matching space value instead.
+    """
 
-        plugin = GoodmemPlugin(
-            base_url=_BASE_URL, api_key=_API_KEY,
-            space_id=space_id, top_k=5, debug=True,
-        )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_a2_agent",
-            instruction="Answer questions based on what you know.",
-        )
-        app = App(name="envvar_a2_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
+    name: str
+    pre_create: bool
+    params: Tuple[str, ...] = ()
+    env_var: Optional[str] = None
 
-        await _run_goldfish_session1_plugin(runner, app.name)
-        _wait_for_indexing()
-        response2 = await _run_goldfish_session2_plugin(runner, app.name)
-        _assert_goldfish_recalled(response2)
 
-    async def test_a3_space_id_and_name_both_match(
-        self, cleanup_spaces: List[str], gm_client: GoodmemClient
+# Env-var cases read GOODMEM_SPACE_* from the environment; under
+# ``--dist loadgroup`` keep them together on one worker.
+_ENV_GROUP = pytest.mark.xdist_group(name="envvar_fallback")
+
+_HAPPY_CASES = [
+    # A2: Pin a pre-existing space by ID. Both sessions use space_id.
+    pytest.param(
+        _HappyCase("envvar_a2", pre_create=True, params=("space_id",)),
+        id="A2",
+    ),
+    # A3: Both space_id and space_name set, matching. Consistency check passes.
+    pytest.param(
+        _HappyCase(
+            "envvar_a3", pre_create=True, params=("space_id", "space_name"),
+        ),
+        id="A3",
+    ),
+    # D1: Pin a valid embedder_id. Memory works normally.
+    pytest.param(
+        _HappyCase(
+            "envvar_d1", pre_create=False,
+            params=("embedder_id", "space_name"),
+        ),
+        id="D1",
+    ),
+    # E1: GOODMEM_SPACE_NAME env var is picked up when no constructor param.
+    pytest.param(
+        _HappyCase(
+            "envvar_e1", pre_create=False, env_var="GOODMEM_SPACE_NAME",
+        ),
+        id="E1", marks=_ENV_GROUP,
+    ),
+    # E2: GOODMEM_SPACE_ID env var is picked up when no constructor param.
+    pytest.param(
+        _HappyCase("envvar_e2", pre_create=True, env_var="GOODMEM_SPACE_ID"),
+        id="E2", marks=_ENV_GROUP,
+    ),
+]
+
+
+class TestHappyPaths:
+
+    @pytest.mark.parametrize("case", _HAPPY_CASES)
+    async def test_goldfish_recall(
+        self, case: _HappyCase, cleanup_spaces: List[str],
+        gm_client: GoodmemClient, default_embedder_id: str,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """A3: Both space_id and space_name set, matching. Consistency check passes."""
-        space_name = _unique_name("envvar_a3")
-        space_id = _pre_create_space(gm_client, space_name)
-        cleanup_spaces.append(space_id)
+        """Session 2 recalls what session 1 stored, however the space is set."""
+        space_name = _unique_name(case.name)
+        space_id: str | None = None
+        if case.pre_create:
+            space_id = await _pre_create_space(
+                gm_client, space_name, default_embedder_id
+            )
+            cleanup_spaces.append(space_id)
+
+        values = {
+            "space_id": space_id,
+            "space_name": space_name,
+            "embedder_id": default_embedder_id,
+        }
+        if case.env_var == "GOODMEM_SPACE_ID":
+            monkeypatch.setenv(case.env_var, space_id)
+        elif case.env_var == "GOODMEM_SPACE_NAME":
+            monkeypatch.setenv(case.env_var, space_name)
 
         plugin = GoodmemPlugin(
             base_url=_BASE_URL, api_key=_API_KEY,
-            space_id=space_id, space_name=space_name,
             top_k=5, debug=True,
+            **{param: values[param] for param in case.params},
         )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_a3_agent",
-            instruction="Answer questions based on what you know.",
-        )
-        app = App(name="envvar_a3_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
+        runner = _plugin_runner(case.name, plugin)
+
+        await _run_goldfish_session1_plugin(runner)
+
+        if space_id is None:
+            # Verify session 1 auto-created the space under space_name
+            space_id = _find_space_id(gm_client, space_name)
+            assert space_id is not None, (
+                f"Space '{space_name}' should have been auto-created"
+            )
+            cleanup_spaces.append(space_id)
+        await _wait_for_indexing(gm_client, space_id)
 
-        await _run_goldfish_session1_plugin(runner, app.name)
-        _wait_for_indexing()
-        response2 = await _run_goldfish_session2_plugin(runner, app.name)
+        response2 = await _run_goldfish_session2_plugin(runner)
         _assert_goldfish_recalled(response2)
 
 
@@ -309,7 +442,7 @@ class TestSpaceResolutionHappy:
 class TestCrossSessionConfig:
 
     async def test_b1_name_then_id(
-        self, cleanup_spaces: List[str]
+        self, cleanup_spaces: List[str], gm_client: GoodmemClient
     ) -> None:
         """B1: Session 1 uses space_name, session 2 uses the resulting space_id."""
         space_name = _unique_name("envvar_b1")
@@ -319,40 +452,28 @@ class TestCrossSessionConfig:
             base_url=_BASE_URL, api_key=_API_KEY,
             space_name=space_name, top_k=5, debug=True,
         )
-        agent1 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b1_agent1",
-            instruction="Answer questions based on what you know.",
-        )
-        app1 = App(name="envvar_b1_app1", root_agent=agent1, plugins=[plugin1])
-        runner1 = InMemoryRunner(app=app1)
+        runner1 = _plugin_runner("envvar_b1_s1", plugin1)
 
-        await _run_goldfish_session1_plugin(runner1, app1.name)
-        _wait_for_indexing()
+        await _run_goldfish_session1_plugin(runner1)
 
         # Discover the space_id created in session 1
-        client = GoodmemClient(_BASE_URL, _API_KEY)
-        space_id = _find_space_id(client, space_name)
-        client.close()
+        space_id = _find_space_id(gm_client, space_name)
         assert space_id is not None, f"Space '{space_name}' should have been auto-created"
         cleanup_spaces.append(space_id)
+        await _wait_for_indexing(gm_client, space_id)
 
         # -- Session 2: plugin with space_id only ------------------------------
         plugin2 = GoodmemPlugin(
             base_url=_BASE_URL, api_key=_API_KEY,
             space_id=space_id, top_k=5, debug=True,
         )
-        agent2 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b1_agent2",
-            instruction="Answer questions based on what you know.",
-        )
-        app2 = App(name="envvar_b1_app2", root_agent=agent2, plugins=[plugin2])
-        runner2 = InMemoryRunner(app=app2)
+        runner2 = _plugin_runner("envvar_b1_s2", plugin2)
 
-        response2 = await _run_goldfish_session2_plugin(runner2, app2.name)
+        response2 = await _run_goldfish_session2_plugin(runner2)
         _assert_goldfish_recalled(response2)
 
     async def test_b2_plugin_writes_tools_read_same_name(
-        self, cleanup_spaces: List[str]
+        self, cleanup_spaces: List[str], gm_client: GoodmemClient
     ) -> None:
         """B2: Plugin writes in session 1, tools read in session 2, same space_name."""
         space_name = _unique_name("envvar_b2")
@@ -362,44 +483,28 @@ class TestCrossSessionConfig:
             base_url=_BASE_URL, api_key=_API_KEY,
             space_name=space_name, top_k=5, debug=True,
         )
-        agent1 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b2_agent1",
-            instruction="Answer questions based on what you know.",
-        )
-        app1 = App(name="envvar_b2_app1", root_agent=agent1, plugins=[plugin])
-        runner1 = InMemoryRunner(app=app1)
+        runner1 = _plugin_runner("envvar_b2_s1", plugin)
 
-        await _run_goldfish_session1_plugin(runner1, app1.name)
-        _wait_for_indexing()
+        await _run_goldfish_session1_plugin(runner1)
 
         # Register space for cleanup
-        client = GoodmemClient(_BASE_URL, _API_KEY)
-        space_id = _find_space_id(client, space_name)
-        client.close()
-        if space_id:
-            cleanup_spaces.append(space_id)
+        space_id = _find_space_id(gm_client, space_name)
+        assert space_id is not None, f"Space '{space_name}' should have been auto-created"
+        cleanup_spaces.append(space_id)
+        await _wait_for_indexing(gm_client, space_id)
 
         # -- Session 2: tools --------------------------------------------------
         fetch_tool = GoodmemFetchTool(
             base_url=_BASE_URL, api_key=_API_KEY,
             space_name=space_name, top_k=5, debug=True,
         )
-        agent2 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b2_agent2",
-            instruction=(
-                "You have access to memory tools. "
-                "When the user asks a question, ALWAYS use the goodmem_fetch "
-                "tool first to check what you know."
-            ),
-            tools=[fetch_tool],
-        )
-        runner2 = InMemoryRunner(agent=agent2, app_name="envvar_b2_app2")
+        runner2 = _tools_runner("envvar_b2_s2", fetch_tool)
 
-        response2 = await _run_goldfish_session2_tools(runner2, "envvar_b2_app2")
+        response2 = await _run_goldfish_session2_tools(runner2)
         _assert_goldfish_recalled(response2)
 
     async def test_b3_plugin_writes_tools_read_via_id(
-        self, cleanup_spaces: List[str]
+        self, cleanup_spaces: List[str], gm_client: GoodmemClient
     ) -> None:
         """B3: Plugin writes in session 1, tools read in session 2 via space_id."""
         space_name = _unique_name("envvar_b3")
@@ -409,40 +514,24 @@ class TestCrossSessionConfig:
             base_url=_BASE_URL, api_key=_API_KEY,
             space_name=space_name, top_k=5, debug=True,
         )
-        agent1 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b3_agent1",
-            instruction="Answer questions based on what you know.",
-        )
-        app1 = App(name="envvar_b3_app1", root_agent=agent1, plugins=[plugin])
-        runner1 = InMemoryRunner(app=app1)
+        runner1 = _plugin_runner("envvar_b3_s1", plugin)
 
-        await _run_goldfish_session1_plugin(runner1, app1.name)
-        _wait_for_indexing()
+        await _run_goldfish_session1_plugin(runner1)
 
         # Discover space_id
-        client = GoodmemClient(_BASE_URL, _API_KEY)
-        space_id = _find_space_id(client, space_name)
-        client.close()
+        space_id = _find_space_id(gm_client, space_name)
         assert space_id is not None, f"Space '{space_name}' should have been auto-created"
         cleanup_spaces.append(space_id)
+        await _wait_for_indexing(gm_client, space_id)
 
         # -- Session 2: tools with space_id ------------------------------------
         fetch_tool = GoodmemFetchTool(
             base_url=_BASE_URL, api_key=_API_KEY,
             space_id=space_id, top_k=5, debug=True,
         )
-        agent2 = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_b3_agent2",
-            instruction=(
-                "You have access to memory tools. "
-                "When the user asks a question, ALWAYS use the goodmem_fetch "
-                "tool first to check what you know."
-            ),
-            tools=[fetch_tool],
-        )
-        runner2 = InMemoryRunner(agent=agent2, app_name="envvar_b3_app2")
+        runner2 = _tools_runner("envvar_b3_s2", fetch_tool)
 
-        response2 = await _run_goldfish_session2_tools(runner2, "envvar_b3_app2")
+        response2 = await _run_goldfish_session2_tools(runner2)
         _assert_goldfish_recalled(response2)
 
 
@@ -461,15 +550,10 @@ class TestSpaceResolutionErrors:
             base_url=_BASE_URL, api_key=_API_KEY,
             space_id=bogus_id, top_k=5, debug=True,
         )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_c1_agent",
-            instruction="Answer questions.",
-        )
-        app = App(name="envvar_c1_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
+        runner = _plugin_runner("envvar_c1", plugin, instruction="Answer questions.")
 
         session = await runner.session_service.create_session(
-            app_name=app.name, user_id="error_user"
+            app_name=runner.app_name, user_id="error_user"
         )
         msg = types.Content(
             role="user", parts=[types.Part(text="Hello")]
@@ -483,11 +567,14 @@ class TestSpaceResolutionErrors:
                 pass
 
     async def test_c2_space_id_and_name_mismatch(
-        self, cleanup_spaces: List[str], gm_client: GoodmemClient
+        self, cleanup_spaces: List[str], gm_client: GoodmemClient,
+        default_embedder_id: str,
     ) -> None:
         """C2: space_id exists but space_name doesn't match -> ValueError."""
         real_name = _unique_name("envvar_c2_alpha")
-        space_id = _pre_create_space(gm_client, real_name)
+        space_id = await _pre_create_space(
+            gm_client, real_name, default_embedder_id
+        )
         cleanup_spaces.append(space_id)
 
         plugin = GoodmemPlugin(
@@ -495,26 +582,10 @@ class TestSpaceResolutionErrors:
             space_id=space_id, space_name="wrong_name_that_does_not_match",
             top_k=5, debug=True,
         )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_c2_agent",
-            instruction="Answer questions.",
-        )
-        app = App(name="envvar_c2_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
 
-        session = await runner.session_service.create_session(
-            app_name=app.name, user_id="error_user"
-        )
-        msg = types.Content(
-            role="user", parts=[types.Part(text="Hello")]
-        )
-
-        # ADK's PluginManager wraps plugin exceptions in RuntimeError
-        with pytest.raises(RuntimeError, match="does not match|different spaces"):
-            async for _ in runner.run_async(
-                user_id="error_user", session_id=session.id, new_message=msg,
-            ):
-                pass
+        # Resolution fails before any model call; C1 covers the runner path.
+        with pytest.raises(ValueError, match="does not match|different spaces"):
+            await asyncio.to_thread(plugin._get_space_id, _bare_context())
 
 
 # ===================================================================
@@ -524,39 +595,6 @@ class TestSpaceResolutionErrors:
 
 class TestEmbedderResolution:
 
-    async def test_d1_embedder_id_valid(
-        self, cleanup_spaces: List[str], gm_client: GoodmemClient
-    ) -> None:
-        """D1: Pin a valid embedder_id. Memory works normally."""
-        embedder_id = _get_first_embedder_id(gm_client)
-        if embedder_id is None:
-            # No embedders exist yet — let ensure_embedder create one
-            embedder_id = gm_client.ensure_embedder(debug=False)
-
-        space_name = _unique_name("envvar_d1")
-
-        plugin = GoodmemPlugin(
-            base_url=_BASE_URL, api_key=_API_KEY,
-            embedder_id=embedder_id, space_name=space_name,
-            top_k=5, debug=True,
-        )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_d1_agent",
-            instruction="Answer questions based on what you know.",
-        )
-        app = App(name="envvar_d1_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
-
-        await _run_goldfish_session1_plugin(runner, app.name)
-        _wait_for_indexing()
-        response2 = await _run_goldfish_session2_plugin(runner, app.name)
-        _assert_goldfish_recalled(response2)
-
-        # Cleanup
-        space_id = _find_space_id(gm_client, space_name)
-        if space_id:
-            cleanup_spaces.append(space_id)
-
     async def test_d2_embedder_id_nonexistent(self) -> None:
         """D2: embedder_id that does not exist raises ValueError."""
         bogus_id = "00000000-0000-0000-0000-000000000000"
@@ -566,92 +604,7 @@ class TestEmbedderResolution:
             embedder_id=bogus_id, space_name=_unique_name("envvar_d2"),
             top_k=5, debug=True,
         )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_d2_agent",
-            instruction="Answer questions.",
-        )
-        app = App(name="envvar_d2_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
-
-        session = await runner.session_service.create_session(
-            app_name=app.name, user_id="error_user"
-        )
-        msg = types.Content(
-            role="user", parts=[types.Part(text="Hello")]
-        )
-
-        # ADK's PluginManager wraps plugin exceptions in RuntimeError
-        with pytest.raises(RuntimeError, match="not found|not valid"):
-            async for _ in runner.run_async(
-                user_id="error_user", session_id=session.id, new_message=msg,
-            ):
-                pass
-
-
-# ===================================================================
-# Group E: Env Var Fallback — Smoke Tests
-# ===================================================================
-
-
-class TestEnvVarFallback:
-
-    async def test_e1_space_name_env_var(
-        self, cleanup_spaces: List[str], monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """E1: GOODMEM_SPACE_NAME env var is picked up when no constructor param."""
-        space_name = _unique_name("envvar_e1")
-        monkeypatch.setenv("GOODMEM_SPACE_NAME", space_name)
-
-        # Construct plugin with NO space_id or space_name params
-        plugin = GoodmemPlugin(
-            base_url=_BASE_URL, api_key=_API_KEY,
-            top_k=5, debug=True,
-        )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_e1_agent",
-            instruction="Answer questions based on what you know.",
-        )
-        app = App(name="envvar_e1_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
 
-        await _run_goldfish_session1_plugin(runner, app.name)
-        _wait_for_indexing()
-        response2 = await _run_goldfish_session2_plugin(runner, app.name)
-        _assert_goldfish_recalled(response2)
-
-        # Verify the space was created with the env var name
-        client = GoodmemClient(_BASE_URL, _API_KEY)
-        space_id = _find_space_id(client, space_name)
-        client.close()
-        assert space_id is not None, (
-            f"Expected space '{space_name}' to be created via GOODMEM_SPACE_NAME env var"
-        )
-        cleanup_spaces.append(space_id)
-
-    async def test_e2_space_id_env_var(
-        self, cleanup_spaces: List[str], gm_client: GoodmemClient,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """E2: GOODMEM_SPACE_ID env var is picked up when no constructor param."""
-        space_name = _unique_name("envvar_e2")
-        space_id = _pre_create_space(gm_client, space_name)
-        cleanup_spaces.append(space_id)
-
-        monkeypatch.setenv("GOODMEM_SPACE_ID", space_id)
-
-        # Construct plugin with NO space_id or space_name params
-        plugin = GoodmemPlugin(
-            base_url=_BASE_URL, api_key=_API_KEY,
-            top_k=5, debug=True,
-        )
-        agent = LlmAgent(
-            model="gemini-2.5-flash", name="envvar_e2_agent",
-            instruction="Answer questions based on what you know.",
-        )
-        app = App(name="envvar_e2_app", root_agent=agent, plugins=[plugin])
-        runner = InMemoryRunner(app=app)
-
-        await _run_goldfish_session1_plugin(runner, app.name)
-        _wait_for_indexing()
-        response2 = await _run_goldfish_session2_plugin(runner, app.name)
-        _assert_goldfish_recalled(response2)
+        # The runner would hit this while creating the space, before the model.
+        with pytest.raises(ValueError, match="not found|not valid"):
+            await asyncio.to_thread(lambda: plugin.embedder_id)
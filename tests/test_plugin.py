@@ -14,20 +14,30 @@
 
 """Unit tests for GoodmemPlugin including space resolution."""
 
-import json
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Generator,
+    Mapping,
+    Optional,
+    Sequence,
+)
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from google.genai import types
 
+from goodmem_adk import plugin as plugin_module
 from goodmem_adk.client import GoodmemClient
 from goodmem_adk.plugin import GoodmemPlugin
 
-CLIENT_PATCH = "goodmem_adk.plugin.GoodmemClient"
 
-
-def _wire_ensure_embedder(mock_client: MagicMock) -> None:
+def _wire_ensure_embedder(mock_client: Mock) -> None:
     """Wire ensure_embedder on a mock so it delegates to the real impl."""
+    mock_client._embedder_id_cache = None
     mock_client.ensure_embedder = (
         lambda **kw: GoodmemClient.ensure_embedder(mock_client, **kw)
     )
@@ -39,105 +49,174 @@ def _wire_ensure_embedder(mock_client: MagicMock) -> None:
 
 
 # Mock constants
-MOCK_BASE_URL = "https://api.goodmem.ai"
-MOCK_API_KEY = "test-api-key"
-MOCK_EMBEDDER_ID = "test-embedder-id"
-MOCK_SPACE_ID = "test-space-id"
-MOCK_SPACE_NAME = "adk_chat_test_user"
-MOCK_USER_ID = "test_user"
-MOCK_SESSION_ID = "test_session"
-MOCK_MEMORY_ID = "test-memory-id"
+MOCK_BASE_URL: Final = "https://api.goodmem.ai"
+MOCK_API_KEY: Final = "test-api-key"
+MOCK_EMBEDDER_ID: Final = "test-embedder-id"
+MOCK_SPACE_ID: Final = "test-space-id"
+MOCK_SPACE_NAME: Final = "adk_chat_test_user"
+MOCK_USER_ID: Final = "test_user"
+MOCK_SESSION_ID: Final = "test_session"
+MOCK_MEMORY_ID: Final = "test-memory-id"
+
+# Constructor arguments make_plugin fills in unless a test overrides them.
+_PLUGIN_DEFAULTS: Final = MappingProxyType({
+    "base_url": MOCK_BASE_URL,
+    "api_key": MOCK_API_KEY,
+    "embedder_id": MOCK_EMBEDDER_ID,
+})
+
+# Canned client payloads, frozen so they can be shared across tests: the
+# plugin only reads them, and an accidental write fails loudly instead of
+# leaking into the next test.
+_EMBEDDER_LIST = (
+    MappingProxyType({"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}),
+)
+_INSERT_OK = MappingProxyType(
+    {"memoryId": MOCK_MEMORY_ID, "processingStatus": "COMPLETED"}
+)
+_MEMORY_METADATA = MappingProxyType({"user_id": MOCK_USER_ID, "role": "user"})
+_MEMORY_BATCH = (
+    MappingProxyType({"memoryId": MOCK_MEMORY_ID, "metadata": _MEMORY_METADATA}),
+)
+
+# Validated once and shared; on_user_message_callback only reads it.
+_HELLO_CONTENT = types.Content(
+    role="user", parts=[types.Part(text="Hello, how are you?")]
+)
+
+# Default return values re-applied to the shared client mock before each test.
+_DEFAULT_RETURNS = {
+    "list_embedders": _EMBEDDER_LIST,
+    "list_spaces": (),
+    "create_space": MappingProxyType({"spaceId": MOCK_SPACE_ID}),
+    "insert_memory": _INSERT_OK,
+    "insert_memory_binary": _INSERT_OK,
+    "retrieve_memories": (),
+    "get_memory_by_id": _MEMORY_BATCH[0],
+    "get_memories_batch": _MEMORY_BATCH,
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_client_cls() -> Generator[MagicMock, None, None]:
+    """Patch GoodmemClient once for the module instead of once per test."""
+    with patch.object(plugin_module, "GoodmemClient") as mock_cls:
+        client = Mock(spec_set=GoodmemClient)
+        # The lambdas are plain attributes, so reset_mock() leaves them be.
+        _wire_ensure_embedder(client)
+        mock_cls.return_value = client
+        yield mock_cls
+
+
+# list_spaces results per space name for the multi-user isolation test.
+_PER_USER_SPACES = MappingProxyType({
+    f"adk_chat_{user}": (
+        MappingProxyType(
+            {"name": f"adk_chat_{user}", "spaceId": f"space_{user}"}
+        ),
+    )
+    for user in ("alice", "bob")
+})
+
+
+def _per_user_spaces(
+    *, name: Optional[str] = None, **kwargs: Any
+) -> Sequence[Mapping[str, str]]:
+    """list_spaces side effect: one existing ``adk_chat_<user>`` space each."""
+    return _PER_USER_SPACES.get(name, ())
+
+
+def _make_context(
+    user_id: str = MOCK_USER_ID, **attrs: Any
+) -> SimpleNamespace:
+    """A callback context as a plain attribute bag, with empty state by default."""
+    attrs.setdefault("state", {})
+    return SimpleNamespace(user_id=user_id, **attrs)
+
+
+@pytest.fixture
+def mock_goodmem_client(_patched_client_cls: MagicMock) -> Mock:
+    """The shared client mock, reset to its default return values."""
+    client = _patched_client_cls.return_value
+    client.reset_mock(return_value=True, side_effect=True)
+    for name, value in _DEFAULT_RETURNS.items():
+        getattr(client, name).return_value = value
+    client._embedder_id_cache = None
+    return client
+
+
+@pytest.fixture
+def make_plugin(
+    mock_goodmem_client: Mock,
+) -> Callable[..., GoodmemPlugin]:
+    """Build a plugin with the mock defaults, overridden by keyword."""
+
+    def _make(**overrides: Any) -> GoodmemPlugin:
+        return GoodmemPlugin(**{**_PLUGIN_DEFAULTS, **overrides})
+
+    return _make
 
 
 class TestGoodmemPlugin:
-    """Tests for GoodmemPlugin."""
+    """Tests for GoodmemPlugin.
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> MagicMock:
-        with patch(CLIENT_PATCH) as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            mock_client.list_spaces.return_value = []
-            mock_client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            mock_client.insert_memory.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-                "processingStatus": "COMPLETED",
-            }
-            mock_client.insert_memory_binary.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-                "processingStatus": "COMPLETED",
-            }
-            mock_client.retrieve_memories.return_value = []
-            mock_client.get_memory_by_id.return_value = {
-                "memoryId": MOCK_MEMORY_ID,
-                "metadata": {"user_id": MOCK_USER_ID, "role": "user"},
-            }
-            mock_client.get_memories_batch.return_value = [
-                {
-                    "memoryId": MOCK_MEMORY_ID,
-                    "metadata": {"user_id": MOCK_USER_ID, "role": "user"},
-                }
-            ]
-            _wire_ensure_embedder(mock_client)
-            mock_client_class.return_value = mock_client
-            yield mock_client
+    The async callback tests share one module-scoped event loop; the plugin
+    holds no loop-bound state. The scope is set per test rather than through
+    ``pytestmark``, which would also mark the sync tests here.
+    """
 
     @pytest.fixture
-    def chat_plugin(self, mock_goodmem_client: MagicMock) -> GoodmemPlugin:
-        return GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            top_k=5,
-            debug=False,
-        )
+    def chat_plugin(
+        self, make_plugin: Callable[..., GoodmemPlugin]
+    ) -> GoodmemPlugin:
+        return make_plugin(top_k=5, debug=False)
 
     # -- initialization ---------------------------------------------------------
 
-    def test_plugin_initialization(self, chat_plugin: GoodmemPlugin) -> None:
-        assert chat_plugin.name == "GoodmemPlugin"
-        assert chat_plugin.top_k == 5
-
-    def test_plugin_initialization_no_embedder_id(
-        self, mock_goodmem_client: MagicMock
-    ) -> None:
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL, api_key=MOCK_API_KEY, top_k=5
-        )
-        assert plugin._embedder_id is None
-
-    def test_plugin_initialization_no_network_call(
-        self, mock_goodmem_client: MagicMock
+    @pytest.mark.parametrize(
+        "overrides, err_match",
+        [
+            pytest.param({"top_k": 5}, None, id="defaults"),
+            pytest.param(
+                {"embedder_id": None, "top_k": 5}, None, id="no_embedder_id"
+            ),
+            pytest.param(
+                {"base_url": None}, "GOODMEM_BASE_URL", id="requires_base_url"
+            ),
+            pytest.param(
+                {"api_key": None}, "GOODMEM_API_KEY", id="requires_api_key"
+            ),
+        ],
+    )
+    def test_plugin_initialization(
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        overrides: Dict[str, Any],
+        err_match: Optional[str],
     ) -> None:
-        GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
+        if err_match is not None:
+            with pytest.raises(ValueError, match=err_match):
+                make_plugin(**overrides)
+            return
+
+        plugin = make_plugin(**overrides)
+        assert plugin.name == "GoodmemPlugin"
+        assert plugin.top_k == 5
+        assert plugin._embedder_id == overrides.get(
+            "embedder_id", MOCK_EMBEDDER_ID
+        )
+        # The embedder is resolved lazily, never at construction.
         mock_goodmem_client.list_embedders.assert_not_called()
 
-    def test_plugin_initialization_requires_base_url(self) -> None:
-        with pytest.raises(ValueError):
-            GoodmemPlugin(base_url=None, api_key=MOCK_API_KEY)
-
-    def test_plugin_initialization_requires_api_key(self) -> None:
-        with pytest.raises(ValueError):
-            GoodmemPlugin(base_url=MOCK_BASE_URL, api_key=None)
-
     # -- _get_space_id ----------------------------------------------------------
 
-    @pytest.mark.asyncio
-    async def test_get_space_id_creates_new_space(
+    def test_get_space_id_creates_new_space(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        mock_goodmem_client.list_spaces.return_value = []
-        mock_context = MagicMock()
-        mock_context.user_id = MOCK_USER_ID
-        mock_context.state = {}
+        mock_context = _make_context()
 
         space_id = chat_plugin._get_space_id(mock_context)
 
@@ -150,33 +229,29 @@ class TestGoodmemPlugin:
         assert space_id == MOCK_SPACE_ID
         assert mock_context.state["_goodmem_space_id"] == MOCK_SPACE_ID
 
-    @pytest.mark.asyncio
-    async def test_get_space_id_uses_existing_space(
+    def test_get_space_id_uses_existing_space(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "existing-space-id", "name": MOCK_SPACE_NAME}
         ]
-        mock_context = MagicMock()
-        mock_context.user_id = MOCK_USER_ID
-        mock_context.state = {}
+        mock_context = _make_context()
 
         space_id = chat_plugin._get_space_id(mock_context)
 
         mock_goodmem_client.create_space.assert_not_called()
         assert space_id == "existing-space-id"
 
-    @pytest.mark.asyncio
-    async def test_get_space_id_uses_cache(
+    def test_get_space_id_uses_cache(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        mock_context = MagicMock()
-        mock_context.user_id = MOCK_USER_ID
-        mock_context.state = {"_goodmem_space_id": "cached-space-id"}
+        mock_context = _make_context(
+            state={"_goodmem_space_id": "cached-space-id"}
+        )
 
         space_id = chat_plugin._get_space_id(mock_context)
 
@@ -185,42 +260,37 @@ class TestGoodmemPlugin:
 
     # -- callbacks --------------------------------------------------------------
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_on_user_message_logs_text(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        state_dict = {"_goodmem_space_id": MOCK_SPACE_ID}
-
-        class MockSession:
-            id = MOCK_SESSION_ID
-            state = state_dict
-
-        mock_context = MagicMock(spec=["user_id", "session"])
-        mock_context.user_id = MOCK_USER_ID
-        mock_context.session = MockSession()
-
-        user_message = types.Content(
-            role="user", parts=[types.Part(text="Hello, how are you?")]
+        # An invocation context: state lives on the session, not the context.
+        mock_context = SimpleNamespace(
+            user_id=MOCK_USER_ID,
+            session=SimpleNamespace(
+                id=MOCK_SESSION_ID,
+                state={"_goodmem_space_id": MOCK_SPACE_ID},
+            ),
         )
 
         await chat_plugin.on_user_message_callback(
-            invocation_context=mock_context, user_message=user_message
+            invocation_context=mock_context, user_message=_HELLO_CONTENT
         )
 
         mock_goodmem_client.insert_memory.assert_called_once()
-        call_args = mock_goodmem_client.insert_memory.call_args
-        assert "User: Hello, how are you?" in str(call_args)
+        assert mock_goodmem_client.insert_memory.call_args.args == (
+            MOCK_SPACE_ID, "User: Hello, how are you?", "text/plain"
+        )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_before_model_callback_augments_request(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        mock_context = MagicMock()
-        mock_context.user_id = MOCK_USER_ID
+        mock_context = _make_context()
 
         mock_goodmem_client.retrieve_memories.return_value = [
             {
@@ -240,12 +310,10 @@ class TestGoodmemPlugin:
             {"memoryId": "mem1", "metadata": {"role": "user"}}
         ]
 
-        mock_request = MagicMock()
-        mock_part = MagicMock()
-        mock_part.text = "Current user query"
-        mock_content = MagicMock()
-        mock_content.parts = [mock_part]
-        mock_request.contents = [mock_content]
+        mock_part = SimpleNamespace(text="Current user query")
+        mock_request = SimpleNamespace(
+            contents=[SimpleNamespace(parts=[mock_part])]
+        )
 
         result = await chat_plugin.before_model_callback(
             callback_context=mock_context, llm_request=mock_request
@@ -256,78 +324,57 @@ class TestGoodmemPlugin:
         assert "Previous conversation" in mock_part.text
         assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_after_model_callback_logs_response(
         self,
         chat_plugin: GoodmemPlugin,
-        mock_goodmem_client: MagicMock,
+        mock_goodmem_client: Mock,
     ) -> None:
-        mock_context = MagicMock()
-        mock_context.user_id = MOCK_USER_ID
-        mock_context.session = MagicMock()
-        mock_context.session.id = MOCK_SESSION_ID
-        mock_context.state = {"_goodmem_space_id": MOCK_SPACE_ID}
-
-        mock_response = MagicMock()
-        mock_content = MagicMock()
-        mock_content.text = "This is the LLM response"
-        mock_response.content = mock_content
+        mock_context = _make_context(
+            session=SimpleNamespace(id=MOCK_SESSION_ID),
+            state={"_goodmem_space_id": MOCK_SPACE_ID},
+        )
+        mock_response = SimpleNamespace(
+            content=SimpleNamespace(text="This is the LLM response")
+        )
 
         await chat_plugin.after_model_callback(
             callback_context=mock_context, llm_response=mock_response
         )
 
         mock_goodmem_client.insert_memory.assert_called()
-        assert "LLM: This is the LLM response" in str(
-            mock_goodmem_client.insert_memory.call_args
+        assert mock_goodmem_client.insert_memory.call_args.args == (
+            MOCK_SPACE_ID, "LLM: This is the LLM response", "text/plain"
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "user_id, other_user",
+        [("alice", "bob"), ("bob", "alice")],
+    )
     async def test_multi_user_isolation(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        user_id: str,
+        other_user: str,
     ) -> None:
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
-
-        def list_spaces_side_effect(*, name=None, **kwargs):
-            if name == "adk_chat_alice":
-                return [{"name": "adk_chat_alice", "spaceId": "space_alice"}]
-            if name == "adk_chat_bob":
-                return [{"name": "adk_chat_bob", "spaceId": "space_bob"}]
-            return []
-
-        mock_goodmem_client.list_spaces.side_effect = list_spaces_side_effect
-
-        alice_context = MagicMock()
-        alice_context.user_id = "alice"
-        alice_context.session = MagicMock(id="session_alice")
-        alice_context.state = {}
-
-        bob_context = MagicMock()
-        bob_context.user_id = "bob"
-        bob_context.session = MagicMock(id="session_bob")
-        bob_context.state = {}
-
-        alice_response = MagicMock()
-        alice_response.content = MagicMock(text="Alice secret")
-
-        bob_response = MagicMock()
-        bob_response.content = MagicMock(text="Bob secret")
+        """A plugin that just served another user still writes to user_id's space."""
+        plugin = make_plugin()
+        mock_goodmem_client.list_spaces.side_effect = _per_user_spaces
+
+        for uid in (other_user, user_id):
+            await plugin.after_model_callback(
+                callback_context=_make_context(
+                    uid, session=SimpleNamespace(id=f"session_{uid}")
+                ),
+                llm_response=SimpleNamespace(
+                    content=SimpleNamespace(text=f"{uid} secret")
+                ),
+            )
 
-        await plugin.after_model_callback(
-            callback_context=alice_context, llm_response=alice_response
-        )
         calls = mock_goodmem_client.insert_memory.call_args_list
-        assert calls[-1][0][0] == "space_alice"
-
-        await plugin.after_model_callback(
-            callback_context=bob_context, llm_response=bob_response
-        )
-        calls = mock_goodmem_client.insert_memory.call_args_list
-        assert calls[-1][0][0] == "space_bob"
+        assert calls[-1].args[0] == f"space_{user_id}"
 
 
 # ---------------------------------------------------------------------------
@@ -338,42 +385,17 @@ class TestGoodmemPlugin:
 class TestPluginSpaceResolution:
     """Tests for space_id / space_name override in the plugin."""
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> MagicMock:
-        with patch(CLIENT_PATCH) as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            mock_client.list_spaces.return_value = []
-            mock_client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            mock_client.insert_memory.return_value = {"memoryId": MOCK_MEMORY_ID}
-            mock_client.retrieve_memories.return_value = []
-            mock_client.get_memories_batch.return_value = []
-            _wire_ensure_embedder(mock_client)
-            mock_client_class.return_value = mock_client
-            yield mock_client
-
-    def _make_context(self, user_id: str = MOCK_USER_ID) -> MagicMock:
-        ctx = MagicMock()
-        ctx.user_id = user_id
-        ctx.state = {}
-        return ctx
-
     def test_space_id_param_exists(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """space_id set and space exists → used directly, no create."""
         mock_goodmem_client.get_space.return_value = {
             "spaceId": "explicit-id", "name": "some-space"
         }
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="explicit-id",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="explicit-id")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
 
         assert sid == "explicit-id"
@@ -382,37 +404,31 @@ class TestPluginSpaceResolution:
         mock_goodmem_client.create_space.assert_not_called()
 
     def test_space_id_not_found_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """space_id set but doesn't exist → ValueError."""
         mock_goodmem_client.get_space.return_value = None
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="nonexistent-id",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="nonexistent-id")
+        ctx = _make_context()
         with pytest.raises(ValueError, match="not found"):
             plugin._get_space_id(ctx)
         mock_goodmem_client.get_space.assert_called_once_with("nonexistent-id")
         mock_goodmem_client.create_space.assert_not_called()
 
     def test_space_id_env_var(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         mock_goodmem_client.get_space.return_value = {
             "spaceId": "env-id", "name": "env-space"
         }
-        with patch.dict(
-            "os.environ", {"GOODMEM_SPACE_ID": "env-id"}, clear=False
-        ):
-            plugin = GoodmemPlugin(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-            )
-        ctx = self._make_context()
+        monkeypatch.setenv("GOODMEM_SPACE_ID", "env-id")
+        plugin = make_plugin()
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
 
         assert sid == "env-id"
@@ -420,18 +436,15 @@ class TestPluginSpaceResolution:
         mock_goodmem_client.list_spaces.assert_not_called()
 
     def test_space_name_param_overrides_default(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "custom-id", "name": "custom_space_name"}
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_name="custom_space_name",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_name="custom_space_name")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
 
         assert sid == "custom-id"
@@ -440,22 +453,17 @@ class TestPluginSpaceResolution:
         )
 
     def test_space_name_env_var(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "env-name-id", "name": "env_space_name"}
         ]
-        with patch.dict(
-            "os.environ",
-            {"GOODMEM_SPACE_NAME": "env_space_name"},
-            clear=False,
-        ):
-            plugin = GoodmemPlugin(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-            )
-        ctx = self._make_context()
+        monkeypatch.setenv("GOODMEM_SPACE_NAME", "env_space_name")
+        plugin = make_plugin()
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
 
         assert sid == "env-name-id"
@@ -464,72 +472,55 @@ class TestPluginSpaceResolution:
         )
 
     def test_space_id_and_name_matching(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """No error when both refer to the same space."""
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "same-id", "name": "my_space"}
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="same-id",
-            space_name="my_space",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="same-id", space_name="my_space")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
         assert sid == "same-id"
 
     def test_space_id_and_name_mismatch_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "other-id", "name": "my_space"}
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="wrong-id",
-            space_name="my_space",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="wrong-id", space_name="my_space")
+        ctx = _make_context()
         with pytest.raises(ValueError, match="refer to different spaces"):
             plugin._get_space_id(ctx)
 
     def test_space_id_and_name_not_found_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
-        mock_goodmem_client.list_spaces.return_value = []
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="some-id",
-            space_name="nonexistent",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="some-id", space_name="nonexistent")
+        ctx = _make_context()
         with pytest.raises(
             ValueError, match="does not match any existing space"
         ):
             plugin._get_space_id(ctx)
 
     def test_space_id_validation_runs_once(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """Validation between space_id and space_name runs only on first call."""
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "same-id", "name": "my_space"}
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_id="same-id",
-            space_name="my_space",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_id="same-id", space_name="my_space")
+        ctx = _make_context()
 
         plugin._get_space_id(ctx)
         plugin._get_space_id(ctx)
@@ -538,45 +529,33 @@ class TestPluginSpaceResolution:
         mock_goodmem_client.list_spaces.assert_called_once()
 
     def test_space_id_param_overrides_env(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         mock_goodmem_client.get_space.return_value = {
             "spaceId": "param-id", "name": "param-space"
         }
-        with patch.dict(
-            "os.environ",
-            {"GOODMEM_SPACE_ID": "env-id"},
-            clear=False,
-        ):
-            plugin = GoodmemPlugin(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-                space_id="param-id",
-            )
-        ctx = self._make_context()
+        monkeypatch.setenv("GOODMEM_SPACE_ID", "env-id")
+        plugin = make_plugin(space_id="param-id")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
         assert sid == "param-id"
         mock_goodmem_client.get_space.assert_called_once_with("param-id")
 
     def test_space_name_param_overrides_env(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         mock_goodmem_client.list_spaces.return_value = [
             {"spaceId": "param-name-id", "name": "param_space_name"}
         ]
-        with patch.dict(
-            "os.environ",
-            {"GOODMEM_SPACE_NAME": "env_space_name"},
-            clear=False,
-        ):
-            plugin = GoodmemPlugin(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-                embedder_id=MOCK_EMBEDDER_ID,
-                space_name="param_space_name",
-            )
-        ctx = self._make_context()
+        monkeypatch.setenv("GOODMEM_SPACE_NAME", "env_space_name")
+        plugin = make_plugin(space_name="param_space_name")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
         assert sid == "param-name-id"
         mock_goodmem_client.list_spaces.assert_called_once_with(
@@ -584,20 +563,16 @@ class TestPluginSpaceResolution:
         )
 
     def test_space_name_auto_creates_if_not_exists(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """space_name auto-creates the space when it doesn't exist."""
-        mock_goodmem_client.list_spaces.return_value = []
         mock_goodmem_client.create_space.return_value = {
             "spaceId": "new-custom-id"
         }
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-            space_name="my_custom_space",
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(space_name="my_custom_space")
+        ctx = _make_context()
         sid = plugin._get_space_id(ctx)
 
         assert sid == "new-custom-id"
@@ -617,38 +592,14 @@ class TestPluginSpaceResolution:
 class TestPluginEmbedderPriority:
     """Tests for embedder resolution priority in the plugin."""
 
-    @pytest.fixture
-    def mock_goodmem_client(self) -> MagicMock:
-        with patch(CLIENT_PATCH) as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.list_embedders.return_value = [
-                {"embedderId": MOCK_EMBEDDER_ID, "name": "Test Embedder"}
-            ]
-            mock_client.list_spaces.return_value = []
-            mock_client.create_space.return_value = {"spaceId": MOCK_SPACE_ID}
-            mock_client.insert_memory.return_value = {"memoryId": MOCK_MEMORY_ID}
-            mock_client.retrieve_memories.return_value = []
-            mock_client.get_memories_batch.return_value = []
-            _wire_ensure_embedder(mock_client)
-            mock_client_class.return_value = mock_client
-            yield mock_client
-
-    def _make_context(self, user_id: str = MOCK_USER_ID) -> MagicMock:
-        ctx = MagicMock()
-        ctx.user_id = user_id
-        ctx.state = {}
-        return ctx
-
     def test_embedder_id_specified_and_valid(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """GOODMEM_EMBEDDER_ID if set and valid → used."""
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id=MOCK_EMBEDDER_ID,
-        )
-        ctx = self._make_context()
+        plugin = make_plugin()
+        ctx = _make_context()
         plugin._get_space_id(ctx)
 
         mock_goodmem_client.create_space.assert_called_once_with(
@@ -656,34 +607,31 @@ class TestPluginEmbedderPriority:
         )
 
     def test_embedder_id_specified_invalid_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """GOODMEM_EMBEDDER_ID if set but not found → ValueError."""
         mock_goodmem_client.list_embedders.return_value = [
             {"embedderId": "other-emb", "name": "Other"}
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-            embedder_id="nonexistent-emb",
-        )
+        plugin = make_plugin(embedder_id="nonexistent-emb")
         with pytest.raises(ValueError, match="not found"):
             plugin._get_embedder_id()
         mock_goodmem_client.create_embedder.assert_not_called()
 
     def test_first_available_embedder_used(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
     ) -> None:
         """When no embedder_id given, first available embedder is used."""
         mock_goodmem_client.list_embedders.return_value = [
             {"embedderId": "first-emb", "name": "First"},
             {"embedderId": "second-emb", "name": "Second"},
         ]
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-        )
-        ctx = self._make_context()
+        plugin = make_plugin(embedder_id=None)
+        ctx = _make_context()
         plugin._get_space_id(ctx)
 
         mock_goodmem_client.create_space.assert_called_once_with(
@@ -691,24 +639,20 @@ class TestPluginEmbedderPriority:
         )
 
     def test_auto_create_embedder_with_google_api_key(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """No embedders + GOOGLE_API_KEY set → auto-create gemini embedder."""
         mock_goodmem_client.list_embedders.return_value = []
         mock_goodmem_client.create_embedder.return_value = {
             "embedderId": "auto-created-emb"
         }
-        with patch.dict(
-            "os.environ",
-            {"GOOGLE_API_KEY": "test-google-key"},
-            clear=False,
-        ):
-            plugin = GoodmemPlugin(
-                base_url=MOCK_BASE_URL,
-                api_key=MOCK_API_KEY,
-            )
-            ctx = self._make_context()
-            plugin._get_space_id(ctx)
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-google-key")
+        plugin = make_plugin(embedder_id=None)
+        ctx = _make_context()
+        plugin._get_space_id(ctx)
 
         mock_goodmem_client.create_embedder.assert_called_once()
         mock_goodmem_client.create_space.assert_called_once_with(
@@ -716,18 +660,15 @@ class TestPluginEmbedderPriority:
         )
 
     def test_no_embedders_no_api_key_raises(
-        self, mock_goodmem_client: MagicMock
+        self,
+        mock_goodmem_client: Mock,
+        make_plugin: Callable[..., GoodmemPlugin],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """No embedders + no GOOGLE_API_KEY → ValueError."""
         mock_goodmem_client.list_embedders.return_value = []
-        plugin = GoodmemPlugin(
-            base_url=MOCK_BASE_URL,
-            api_key=MOCK_API_KEY,
-        )
-        with patch.dict(
-            "os.environ",
-            {"GOOGLE_API_KEY": "", "GEMINI_API_KEY": ""},
-            clear=False,
-        ):
-            with pytest.raises(ValueError, match="No embedders available"):
-                plugin._get_embedder_id()
+        plugin = make_plugin(embedder_id=None)
+        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="No embedders available"):
+            plugin._get_embedder_id()
@@ -35,6 +35,7 @@ CLIENT_PATCH = "goodmem_adk.tools.GoodmemClient"
 
 def _wire_ensure_embedder(mock_client: MagicMock) -> None:
     """Wire ensure_embedder on a mock so it delegates to the real impl."""
+    mock_client._embedder_id_cache = None
     mock_client.ensure_embedder = (
         lambda **kw: GoodmemClient.ensure_embedder(mock_client, **kw)
     )
@@ -234,9 +235,9 @@ class TestGoodmemFetch:
                     }
                 }
             ]
-            mock_client.get_memory_by_id.return_value = {
-                "metadata": {"user_id": "test-user"}
-            }
+            mock_client.get_memories_batch.return_value = [
+                {"memoryId": "memory-123", "metadata": {"user_id": "test-user"}}
+            ]
 
             response = await goodmem_fetch(
                 query="test query",
@@ -250,6 +251,10 @@ class TestGoodmemFetch:
             assert response.count == 1
             assert len(response.memories) == 1
             assert response.memories[0].memory_id == "memory-123"
+            assert response.memories[0].metadata == {"user_id": "test-user"}
+            mock_client.get_memories_batch.assert_called_once_with(
+                ["memory-123"]
+            )
 
     @pytest.mark.asyncio
     async def test_fetch_no_results(self, mock_config, mock_tool_context):